@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+import typing as tp
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Model
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+if tp.TYPE_CHECKING:
+    from app.core.views import APIView
+
+CACHED_HEADERS = ['content-type', 'etag', 'last-modified', 'vary', 'cache-control']
+
+LOCK_POLL_INTERVAL = 0.05
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    content: bytes
+    headers: tuple[tuple[str, str], ...]
+    expires_at: float
+
+    @classmethod
+    def from_response(cls, response: HttpResponse, timeout: int) -> CachedResponse:
+        return cls(
+            status_code=response.status_code,
+            content=response.content,
+            headers=tuple(
+                (header, value)
+                for header, value in response.items()
+                if header.lower() in CACHED_HEADERS
+            ),
+            expires_at=time.time() + timeout,
+        )
+
+    def to_response(self) -> HttpResponse:
+        return HttpResponse(
+            content=self.content,
+            status=self.status_code,
+            headers=dict(self.headers),
+        )
+
+
+class LocalLRUCache:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            if entry.expires_at <= time.time():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+local_cache = LocalLRUCache(
+    max_entries=getattr(settings, 'RESPONSE_CACHE_LOCAL_MAX_ENTRIES', 1024),
+)
+
+
+def get_shared_cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def get_generation_key(model: type[Model]) -> str:
+    return f'response-cache:generation:{model._meta.label_lower}'
+
+
+def bump_generation(model: type[Model]) -> None:
+    # Generations are part of every response key, bumping one orphans all the
+    # entries built from the previous value instead of deleting them one by one.
+    cache = get_shared_cache()
+    key = get_generation_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        *,
+        timeout: int = 60,
+        depends_on: tp.Sequence[type[Model]] = (),
+        per_user: bool = True,
+        lock_timeout: int = 10,
+        lock_wait: float = 5.0,
+    ) -> None:
+        self.timeout = timeout
+        self.depends_on = tuple(depends_on)
+        self.per_user = per_user
+        self.lock_timeout = lock_timeout
+        self.lock_wait = lock_wait
+
+    def get_scope(self, user: tp.Any) -> str:
+        if not self.per_user:
+            return 'public'
+
+        if user is None or not user.is_authenticated:
+            return 'anonymous'
+        return f'user:{user.pk}'
+
+    def get_key(
+        self,
+        view: APIView,
+        scope: str,
+        generations: tp.Sequence[int],
+    ) -> str:
+        query = urlencode(sorted(view.request.GET.lists()), doseq=True)
+        raw_key = ':'.join([view.request.path, query, scope, *map(str, generations)])
+        digest = hashlib.md5(raw_key.encode(), usedforsecurity=False).hexdigest()
+        return f'response-cache:{type(view).__qualname__}:{digest}'
+
+    def missing_generations(
+        self,
+        keys: list[str],
+        found: dict[str, int],
+    ) -> dict[str, int]:
+        # A generation that is missing (never bumped or evicted) restarts
+        # from the clock, so entries built before the eviction are never hit.
+        return {key: time.time_ns() for key in keys if key not in found}
+
+    def get_models(self, view_class: type[APIView]) -> tuple[type[Model], ...]:
+        # The view's own model always invalidates its responses, depends_on
+        # adds the models it reads besides.
+        models = list(self.depends_on)
+        if view_class.model is not None:
+            models.append(view_class.model)
+        if view_class.queryset is not None:
+            models.append(view_class.queryset.model)
+        return tuple(dict.fromkeys(models))
+
+    def get_generations(self, view: APIView) -> list[int]:
+        cache = get_shared_cache()
+        keys = [get_generation_key(model) for model in self.get_models(type(view))]
+        found = cache.get_many(keys)
+        for key, value in self.missing_generations(keys, found).items():
+            cache.add(key, value, timeout=None)
+            found[key] = cache.get(key, value)
+        return [found[key] for key in keys]
+
+    async def aget_generations(self, view: APIView) -> list[int]:
+        cache = get_shared_cache()
+        keys = [get_generation_key(model) for model in self.get_models(type(view))]
+        found = await cache.aget_many(keys)
+        for key, value in self.missing_generations(keys, found).items():
+            await cache.aadd(key, value, timeout=None)
+            found[key] = await cache.aget(key, value)
+        return [found[key] for key in keys]
+
+    def is_cacheable(self, response: HttpResponse) -> bool:
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+        )
+
+    def build_response(self, view: APIView, entry: CachedResponse) -> HttpResponse:
+        response = entry.to_response()
+        last_modified = response.headers.get('Last-Modified')
+        return get_conditional_response(
+            view.request,
+            etag=response.headers.get('ETag'),
+            last_modified=last_modified and parse_http_date_safe(last_modified),
+            response=response,
+        )
+
+    def get_or_set(
+        self,
+        view: APIView,
+        compute: tp.Callable[[], HttpResponse],
+    ) -> HttpResponse:
+        cache = get_shared_cache()
+        scope = self.get_scope(getattr(view.request, 'user', None))
+        key = self.get_key(view, scope, self.get_generations(view))
+        entry = local_cache.get(key) or cache.get(key)
+        if entry is not None:
+            local_cache.set(key, entry)
+            return self.build_response(view, entry)
+
+        # Only the worker that takes the lock recomputes the entry, the others
+        # wait for it to show up in the shared cache.
+        lock_key = f'{key}:lock'
+        if not cache.add(lock_key, True, timeout=self.lock_timeout):
+            deadline = time.monotonic() + self.lock_wait
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL_INTERVAL)
+                entry = cache.get(key)
+                if entry is not None:
+                    local_cache.set(key, entry)
+                    return self.build_response(view, entry)
+            return compute()
+
+        try:
+            response = compute()
+            if self.is_cacheable(response):
+                entry = CachedResponse.from_response(response, self.timeout)
+                cache.set(key, entry, timeout=self.timeout)
+                local_cache.set(key, entry)
+            return response
+        finally:
+            cache.delete(lock_key)
+
+    async def aget_or_set(
+        self,
+        view: APIView,
+        compute: tp.Callable[[], tp.Awaitable[HttpResponse]],
+    ) -> HttpResponse:
+        cache = get_shared_cache()
+        auser = getattr(view.request, 'auser', None)
+        scope = self.get_scope(await auser() if self.per_user and auser else None)
+        key = self.get_key(view, scope, await self.aget_generations(view))
+        entry = local_cache.get(key) or await cache.aget(key)
+        if entry is not None:
+            local_cache.set(key, entry)
+            return self.build_response(view, entry)
+
+        lock_key = f'{key}:lock'
+        if not await cache.aadd(lock_key, True, timeout=self.lock_timeout):
+            deadline = time.monotonic() + self.lock_wait
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                entry = await cache.aget(key)
+                if entry is not None:
+                    local_cache.set(key, entry)
+                    return self.build_response(view, entry)
+            return await compute()
+
+        try:
+            response = await compute()
+            if self.is_cacheable(response):
+                entry = CachedResponse.from_response(response, self.timeout)
+                await cache.aset(key, entry, timeout=self.timeout)
+                local_cache.set(key, entry)
+            return response
+        finally:
+            await cache.adelete(lock_key)
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import typing as tp
+from codecs import getincrementaldecoder
+from functools import cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+
+class DecodeError(ValueError):
+    pass
+
+
+def duration_string(value: dt.timedelta) -> str:
+    # ISO 8601 as msgspec writes it natively, e.g. P1DT3601.5S.
+    sign = '-' if value < dt.timedelta(0) else ''
+    value = abs(value)
+    result = f'{value.days}D' if value.days else ''
+    if value.seconds or value.microseconds:
+        seconds = f'{value.seconds}.{value.microseconds:06d}'.rstrip('0').rstrip('.')
+        result = f'{result}T{seconds}S'
+    return f'{sign}P{result or "0D"}'
+
+
+class JSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder with the formats orjson and msgspec write natively, so
+    the output does not depend on the installed backend: datetimes and times
+    keep their microseconds and durations use duration_string().
+    """
+
+    @tp.override
+    def default(self, o: tp.Any) -> tp.Any:
+        if isinstance(o, dt.datetime):
+            return o.isoformat().replace('+00:00', 'Z')
+        if isinstance(o, dt.time) and o.utcoffset() is None:
+            return o.isoformat()
+        if isinstance(o, dt.timedelta):
+            return duration_string(o)
+        return super().default(o)
+
+
+class JSONCodec:
+    name: str
+
+    def dumps(self, data: tp.Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> tp.Any:
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = 'stdlib'
+
+    def __init__(self) -> None:
+        self.encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    @tp.override
+    def dumps(self, data: tp.Any) -> bytes:
+        return self.encoder.encode(data).encode()
+
+    @tp.override
+    def loads(self, data: bytes) -> tp.Any:
+        # json.loads detects the encoding of bytes itself, there is no need
+        # to decode the body into an intermediate str.
+        try:
+            return json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            raise DecodeError(str(error)) from error
+
+
+class OrjsonCodec(JSONCodec):
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.orjson = orjson
+        # Datetimes are encoded natively as ISO 8601 with 'Z' for UTC, the
+        # format JSONEncoder writes too.
+        self.options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        self.default = JSONEncoder().default
+
+    @tp.override
+    def dumps(self, data: tp.Any) -> bytes:
+        return self.orjson.dumps(data, default=self.default, option=self.options)
+
+    @tp.override
+    def loads(self, data: bytes) -> tp.Any:
+        try:
+            return self.orjson.loads(data)
+        except self.orjson.JSONDecodeError as error:
+            raise DecodeError(str(error)) from error
+
+
+class MsgspecCodec(JSONCodec):
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.default = JSONEncoder().default
+        self.encoder = msgspec.json.Encoder(enc_hook=self.enc_hook)
+        self.decoder = msgspec.json.Decoder()
+        self.decode_error = msgspec.DecodeError
+
+    def enc_hook(self, obj: tp.Any) -> tp.Any:
+        # msgspec only encodes the exact builtin types natively, subclasses
+        # such as DRF's ErrorDetail and ReturnDict come through here.
+        for builtin in (str, int, float, dict, list, tuple):
+            if isinstance(obj, builtin):
+                return builtin(obj)
+        return self.default(obj)
+
+    @tp.override
+    def dumps(self, data: tp.Any) -> bytes:
+        return self.encoder.encode(data)
+
+    @tp.override
+    def loads(self, data: bytes) -> tp.Any:
+        try:
+            return self.decoder.decode(data)
+        except self.decode_error as error:
+            raise DecodeError(str(error)) from error
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    codec.name: codec for codec in [OrjsonCodec, MsgspecCodec, StdlibJSONCodec]
+}
+
+
+def load_codec(name: str) -> JSONCodec:
+    if name == 'auto':
+        for codec_class in CODECS.values():
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+
+    codec_class = CODECS.get(name)
+    if codec_class is None:
+        try:
+            codec_class = import_string(name)
+        except ImportError as error:
+            raise ImproperlyConfigured(f'Unknown JSON_CODEC {name!r}.') from error
+
+    try:
+        return codec_class()
+    except ImportError as error:
+        raise ImproperlyConfigured(
+            f'JSON_CODEC is set to {name!r} but its backend is not installed.'
+        ) from error
+
+
+@cache
+def get_codec() -> JSONCodec:
+    return load_codec(getattr(settings, 'JSON_CODEC', 'auto'))
+
+
+def dumps(data: tp.Any) -> bytes:
+    return get_codec().dumps(data)
+
+
+def loads(data: bytes) -> tp.Any:
+    return get_codec().loads(data)
+
+
+WHITESPACE = ' \t\n\r'
+ARRAY_DELIMITERS = WHITESPACE + ',]'
+
+
+def iter_array(
+    read: tp.Callable[[int], bytes],
+    *,
+    chunk_size: int = 64 * 1024,
+) -> tp.Iterator[tp.Any]:
+    """
+    Yields the items of a top-level JSON array read from a stream, keeping
+    only the unparsed tail of the input in memory.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = getincrementaldecoder('utf-8')()
+    buffer = ''
+    position = 0
+    eof = False
+    expecting = '['
+
+    def fill() -> None:
+        nonlocal buffer, position, eof
+        chunk = read(chunk_size)
+        eof = not chunk
+        try:
+            text = text_decoder.decode(chunk, final=eof)
+        except UnicodeDecodeError as error:
+            raise DecodeError(str(error)) from error
+        buffer = buffer[position:] + text
+        position = 0
+
+    def skip_whitespace() -> bool:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return True
+            if eof:
+                return False
+            fill()
+
+    while True:
+        if not skip_whitespace():
+            raise DecodeError('Unexpected end of the JSON array.')
+        char = buffer[position]
+
+        if expecting == '[':
+            if char != '[':
+                raise DecodeError('Expected a JSON array.')
+            position += 1
+            expecting = 'first'
+            continue
+        if expecting == 'after':
+            if char == ']':
+                position += 1
+                break
+            if char != ',':
+                raise DecodeError('Expected "," or "]" between array items.')
+            position += 1
+            expecting = 'item'
+            continue
+        if expecting == 'first' and char == ']':
+            position += 1
+            break
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            if eof:
+                raise DecodeError(str(error)) from error
+            fill()
+            continue
+        # A number could continue in the next chunk, e.g. "2" before ".5".
+        if not eof and (end == len(buffer) or buffer[end] not in ARRAY_DELIMITERS):
+            fill()
+            continue
+        position = end
+        expecting = 'after'
+        yield item
+
+    if skip_whitespace():
+        raise DecodeError('Unexpected data after the JSON array.')
+
+
+@receiver(setting_changed)
+def reset_codec(*, setting: str, **kwargs: tp.Any) -> None:
+    if setting == 'JSON_CODEC':
+        get_codec.cache_clear()
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import typing as tp
+
+from django.db import connections
+
+
+def get_connection_stats() -> dict[str, dict[str, tp.Any]]:
+    stats = {}
+    for connection in connections.all():
+        pool = getattr(connection, 'pool', None)
+        entry: dict[str, tp.Any] = {
+            'vendor': connection.vendor,
+            'pooled': pool is not None,
+        }
+        if pool is not None:
+            # Cumulative psycopg_pool counters (requests_num, connections_num,
+            # requests_wait_ms...) next to the pool_size and pool_available
+            # gauges.
+            entry.update(pool.get_stats())
+        else:
+            # Persistent connections are per thread, this is the current one.
+            entry['conn_max_age'] = connection.settings_dict['CONN_MAX_AGE']
+            entry['connected'] = connection.connection is not None
+        stats[connection.alias] = entry
+    return stats
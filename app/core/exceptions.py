@@ -13,10 +13,12 @@ class APIError(Exception):
         *,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
         details: ErrorDetails = 'A server error occurred.',
+        headers: dict[str, str] | None = None,
     ) -> None:
         super().__init__(details)
         self.status_code = status_code
         self.details = details
+        self.headers = headers or {}
 
 
 class ObjectDoesNotExist(APIError):
@@ -46,3 +48,36 @@ class ValidationError(APIError):
             status_code=self.STATUS_CODE,
             details=details,
         )
+
+
+class Throttled(APIError):
+    STATUS_CODE = status.HTTP_429_TOO_MANY_REQUESTS
+    DETAILS = 'Request was throttled.'
+
+    @tp.override
+    def __init__(
+        self,
+        *,
+        retry_after: int,
+    ) -> None:
+        super().__init__(
+            status_code=self.STATUS_CODE,
+            details=self.DETAILS,
+            headers={'Retry-After': str(retry_after)},
+        )
+        self.retry_after = retry_after
+
+
+class PayloadTooLarge(APIError):
+    STATUS_CODE = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    DETAILS = 'Request body is too large.'
+
+    @tp.override
+    def __init__(
+        self,
+        details: ErrorDetails | None = None,
+    ) -> None:
+        super().__init__(
+            status_code=self.STATUS_CODE,
+            details=details or self.DETAILS,
+        )
@@ -1,12 +1,45 @@
+import typing as tp
+
 from app.core.exceptions import ValidationError
+from app.core.pagination import CursorPage, CursorPaginator
 
 from django_filters import FilterSet
 
 
 class BaseFilterSet(FilterSet):
+    cursor_ordering: tp.Sequence[str] = ('created_at', 'id')
+    page_size: int = 50
+    max_page_size: int = 500
+
     def is_valid(self, raise_exception: bool = False) -> bool:
         valid = super().is_valid()
         if not valid and raise_exception:
             raise ValidationError(self.errors)
 
         return valid
+
+    def get_page_size(self, page_size: str | int | None) -> int:
+        if page_size in (None, ''):
+            return self.page_size
+
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            raise ValidationError({'page_size': ['A valid integer is required.']})
+
+        if page_size < 1:
+            raise ValidationError({'page_size': ['Ensure this value is at least 1.']})
+
+        return min(page_size, self.max_page_size)
+
+    def paginate(
+        self,
+        *,
+        cursor: str | None = None,
+        page_size: str | int | None = None,
+    ) -> CursorPage:
+        paginator = CursorPaginator(
+            ordering=self.cursor_ordering,
+            page_size=self.get_page_size(page_size),
+        )
+        return paginator.paginate(self.qs, cursor)
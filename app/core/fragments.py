@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import hashlib
+import typing as tp
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import translation
+
+SCOPES = ('global', 'user')
+
+
+def get_fragment_cache():
+    return caches[getattr(settings, 'FRAGMENT_CACHE_ALIAS', 'default')]
+
+
+def get_fragment_key(
+    name: str,
+    attrs: tp.Mapping[str, tp.Any],
+    *,
+    version: tp.Any = None,
+    scope: str = 'global',
+    user: tp.Any = None,
+) -> str:
+    if scope not in SCOPES:
+        raise ValueError(f'Unknown fragment scope {scope!r}, expected one of {SCOPES}.')
+
+    owner = ''
+    if scope == 'user':
+        # Anonymous visitors would all share one entry, so there is no per
+        # user fragment to cache for them.
+        if user is None or not user.is_authenticated:
+            raise ValueError("Fragments with scope='user' need an authenticated user.")
+        owner = str(user.pk)
+
+    raw_key = '|'.join(
+        [
+            str(version or ''),
+            owner,
+            translation.get_language() or '',
+            *(f'{key}={attrs[key]}' for key in sorted(attrs)),
+        ]
+    )
+    digest = hashlib.md5(raw_key.encode(), usedforsecurity=False).hexdigest()
+    return f'fragments:{name}:{digest}'
+
+
+def get_or_render(
+    key: str,
+    render: tp.Callable[[], str],
+    *,
+    timeout: int | None = None,
+) -> str:
+    cache = get_fragment_cache()
+    content = cache.get(key)
+    if content is None:
+        content = render()
+        if timeout is None:
+            timeout = getattr(settings, 'FRAGMENT_CACHE_TIMEOUT', 300)
+        cache.set(key, content, timeout=timeout)
+    return content
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+
+class TimeOrderedUUIDGenerator:
+    # UUIDv7 layout (RFC 9562): 48-bit unix_ts_ms | ver | 12-bit rand_a | var |
+    # 62-bit rand_b. rand_a is used as a counter within the same millisecond so
+    # the ids keep increasing inside the process even when several of them are
+    # generated in the same millisecond or the clock steps back.
+    MAX_COUNTER = 0xFFF
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.last_timestamp = 0
+        self.counter = 0
+
+    def __call__(self) -> uuid.UUID:
+        with self.lock:
+            timestamp = time.time_ns() // 1_000_000
+            if timestamp > self.last_timestamp:
+                self.last_timestamp = timestamp
+                # Start at a random point in the lower half to leave room for
+                # the counter to grow.
+                self.counter = int.from_bytes(os.urandom(2)) & (self.MAX_COUNTER >> 1)
+            elif self.counter < self.MAX_COUNTER:
+                self.counter += 1
+            else:
+                self.last_timestamp += 1
+                self.counter = 0
+
+            timestamp = self.last_timestamp
+            counter = self.counter
+
+        rand_b = int.from_bytes(os.urandom(8)) & ((1 << 62) - 1)
+        return uuid.UUID(
+            int=(timestamp << 80)
+            | (0x7 << 76)
+            | (counter << 64)
+            | (0b10 << 62)
+            | rand_b
+        )
+
+
+uuid7 = TimeOrderedUUIDGenerator()
+
+
+def generate_id() -> uuid.UUID:
+    if getattr(settings, 'TIME_ORDERED_IDS', False):
+        return uuid7()
+    return uuid.uuid4()
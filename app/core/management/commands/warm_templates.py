@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import typing as tp
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.core.templates import precompile_templates, slowest_first
+
+
+class Command(BaseCommand):
+    help = (
+        'Compiles every template of templates/ and the app directories and '
+        'reports the compile time of each, slowest first. Workers warm up on '
+        'their own at startup when TEMPLATE_WARMUP is set.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--no-apps',
+            action='store_true',
+            help='Only compile the templates of the TEMPLATES DIRS.',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=None,
+            help='Only list the slowest templates.',
+        )
+
+    def handle(self, *args: tp.Any, **options: tp.Any) -> None:
+        results = precompile_templates(include_apps=not options['no_apps'])
+        compiled = slowest_first(results)
+        for result in compiled[: options['limit']]:
+            self.stdout.write(f'{result.seconds * 1000:8.2f}ms  {result.name}')
+
+        for result in results:
+            if result.error is not None:
+                self.stderr.write(f'{result.name}: skipped, {result.error}')
+
+        total = sum(result.seconds for result in compiled)
+        self.stdout.write(f'Compiled {len(compiled)} templates in {total * 1000:.1f}ms')
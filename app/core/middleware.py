@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+from functools import cached_property
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpRequest, HttpResponseNotModified
+from django.http.response import HttpResponseBase
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+
+class PrecompressedStaticMiddleware(MiddlewareMixin):
+    """
+    Serves STATIC_ROOT files ahead of the rest of the stack, with the .gz
+    sibling written by CompressedManifestStaticFilesStorage when the client
+    accepts it. Files missing from STATIC_ROOT fall through to the views.
+    """
+
+    # Hashed names change with the content, they can be cached forever.
+    immutable_max_age = 365 * 24 * 60 * 60
+    max_age = 60
+
+    @cached_property
+    def hashed_names(self) -> frozenset[str]:
+        return frozenset(getattr(staticfiles_storage, 'hashed_files', {}).values())
+
+    def process_request(self, request: HttpRequest) -> HttpResponseBase | None:
+        static_url = settings.STATIC_URL
+        if (
+            request.method not in ('GET', 'HEAD')
+            or not settings.STATIC_ROOT
+            or not static_url
+            or not request.path_info.startswith(static_url)
+        ):
+            return None
+
+        name = request.path_info.removeprefix(static_url)
+        try:
+            path = safe_join(settings.STATIC_ROOT, name)
+        except SuspiciousFileOperation:
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        encoding = None
+        accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        if ACCEPTS_GZIP.search(accept_encoding) and os.path.isfile(f'{path}.gz'):
+            encoding = 'gzip'
+
+        served_path = f'{path}.gz' if encoding else path
+        stat = os.stat(served_path)
+        if not was_modified_since(
+            request.META.get('HTTP_IF_MODIFIED_SINCE'),
+            stat.st_mtime,
+        ):
+            # Caches refresh the stored response from the 304 headers.
+            response = HttpResponseNotModified()
+            self.set_cache_headers(response, name, stat.st_mtime)
+            return response
+
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        response = FileResponse(open(served_path, 'rb'), content_type=content_type)
+        # FileResponse derives an inline Content-Disposition from the file name,
+        # static assets don't need one.
+        del response['Content-Disposition']
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        self.set_cache_headers(response, name, stat.st_mtime)
+        return response
+
+    def set_cache_headers(
+        self,
+        response: HttpResponseBase,
+        name: str,
+        modified: float,
+    ) -> None:
+        response.headers['Last-Modified'] = http_date(modified)
+        patch_vary_headers(response, ['Accept-Encoding'])
+        if name in self.hashed_names:
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=self.immutable_max_age,
+                immutable=True,
+            )
+        else:
+            patch_cache_control(response, public=True, max_age=self.max_age)
@@ -1,12 +1,12 @@
-import uuid
-
 from django.db import models
 
+from app.core.ids import generate_id
+
 
 class BaseModel(models.Model):
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=generate_id,
         editable=False,
         unique=True,
     )
@@ -15,6 +15,8 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+        # Backs the default (created_at, id) cursor ordering of BaseFilterSet.
+        indexes = [models.Index(fields=['created_at', 'id'])]
 
     REPR_FIELDS = []
 
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime as dt
+import typing as tp
+import uuid
+from dataclasses import dataclass
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from django.db.models.query import QuerySet
+
+from app.core import codecs
+from app.core.exceptions import ValidationError
+
+if tp.TYPE_CHECKING:
+    from app.core.types import DjangoModelType
+
+
+def _to_cursor_value(value: tp.Any) -> tp.Any:
+    # Keep full precision, the cursor must compare equal to the stored value.
+    if isinstance(value, dt.date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+@dataclass(frozen=True)
+class Cursor:
+    position: tuple[tp.Any, ...]
+    reverse: bool = False
+
+    def encode(self) -> str:
+        payload = codecs.dumps(
+            {
+                'p': [_to_cursor_value(value) for value in self.position],
+                'r': self.reverse,
+            }
+        )
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, value: str) -> Cursor:
+        try:
+            payload = codecs.loads(
+                base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+            )
+            return cls(position=tuple(payload['p']), reverse=bool(payload['r']))
+        except (binascii.Error, codecs.DecodeError, KeyError, TypeError) as error:
+            raise ValidationError({'cursor': ['Invalid cursor.']}) from error
+
+
+@dataclass(frozen=True)
+class CursorPage:
+    object_list: list[DjangoModelType]
+    next_cursor: str | None
+    previous_cursor: str | None
+
+
+class CursorPaginator:
+    def __init__(self, *, ordering: tp.Sequence[str], page_size: int) -> None:
+        self.ordering = tuple(ordering)
+        self.page_size = page_size
+
+    @property
+    def reversed_ordering(self) -> tuple[str, ...]:
+        return tuple(
+            field[1:] if field.startswith('-') else f'-{field}'
+            for field in self.ordering
+        )
+
+    def get_position(self, obj: DjangoModelType) -> tuple[tp.Any, ...]:
+        return tuple(getattr(obj, field.lstrip('-')) for field in self.ordering)
+
+    def to_python(
+        self,
+        model: type[DjangoModelType],
+        position: tp.Sequence[tp.Any],
+    ) -> tuple[tp.Any, ...]:
+        # Cursors come from the client, a tampered value must be a 400 rather
+        # than a database error.
+        if len(position) != len(self.ordering):
+            raise ValidationError({'cursor': ['Invalid cursor.']})
+        try:
+            return tuple(
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, position)
+            )
+        except (DjangoValidationError, TypeError, ValueError) as error:
+            raise ValidationError({'cursor': ['Invalid cursor.']}) from error
+
+    def get_position_filter(
+        self,
+        position: tp.Sequence[tp.Any],
+        ordering: tp.Sequence[str],
+    ) -> Q:
+        # (a > x) OR (a = x AND b > y) OR ..., the leading a >= x bound lets the
+        # database seek straight into the (a, b) index instead of scanning it.
+        bound = self.compare(ordering[0], position[0], inclusive=True)
+        condition = Q()
+        for index, field in enumerate(ordering):
+            step = self.compare(field, position[index])
+            for previous_index, previous in enumerate(ordering[:index]):
+                step &= Q(**{previous.lstrip('-'): position[previous_index]})
+            condition |= step
+        return bound & condition
+
+    def compare(self, field: str, value: tp.Any, *, inclusive: bool = False) -> Q:
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        if inclusive:
+            lookup = f'{lookup}e'
+        return Q(**{f'{field.lstrip("-")}__{lookup}': value})
+
+    def paginate(
+        self,
+        queryset: QuerySet[DjangoModelType],
+        cursor: str | None = None,
+    ) -> CursorPage:
+        current = Cursor.decode(cursor) if cursor else None
+        reverse = current is not None and current.reverse
+        ordering = self.reversed_ordering if reverse else self.ordering
+
+        queryset = queryset.order_by(*ordering)
+        if current is not None:
+            position = self.to_python(queryset.model, current.position)
+            queryset = queryset.filter(self.get_position_filter(position, ordering))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = current is not None if reverse else has_more
+        has_previous = has_more if reverse else current is not None
+        return CursorPage(
+            object_list=rows,
+            next_cursor=(
+                Cursor(self.get_position(rows[-1])).encode()
+                if rows and has_next
+                else None
+            ),
+            previous_cursor=(
+                Cursor(self.get_position(rows[0]), reverse=True).encode()
+                if rows and has_previous
+                else None
+            ),
+        )
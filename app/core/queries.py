@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import re
+import time
+import typing as tp
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+
+IN_CLAUSE = re.compile(r'IN \((?:%s, )*%s\)')
+SAVEPOINT = re.compile(r'"s\d+_x\d+"')
+
+
+def normalize_sql(sql: str) -> str:
+    # Queries are parameterized already, only IN lists of different lengths and
+    # generated savepoint names need folding to get the same shape.
+    return SAVEPOINT.sub('"s"', IN_CLAUSE.sub('IN (...)', sql))
+
+
+@dataclass
+class QueryReport:
+    budget: int | None = None
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def repeated(self) -> dict[str, int]:
+        threshold = getattr(settings, 'QUERY_REPEAT_THRESHOLD', 3)
+        return {
+            sql: count
+            for sql, count in self.shapes.most_common()
+            if count >= threshold and not sql.startswith(('SAVEPOINT', 'RELEASE'))
+        }
+
+    @property
+    def exceeds_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def to_header(self) -> str:
+        return (
+            f'count={self.count}; time={self.duration * 1000:.2f}ms; '
+            f'repeated={len(self.repeated)}'
+        )
+
+    def describe(self) -> str:
+        lines = [f'{self.count} queries in {self.duration * 1000:.2f}ms']
+        if self.budget is not None:
+            lines[0] += f' (budget {self.budget})'
+        lines.extend(f'  {count}x {sql}' for sql, count in self.repeated.items())
+        return '\n'.join(lines)
+
+
+class QueryCollector:
+    def __init__(self, *, budget: int | None = None) -> None:
+        self.report = QueryReport(budget=budget)
+        self.stack = ExitStack()
+
+    def __call__(
+        self,
+        execute: tp.Callable[..., tp.Any],
+        sql: str,
+        params: tp.Any,
+        many: bool,
+        context: dict[str, tp.Any],
+    ) -> tp.Any:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.report.duration += time.perf_counter() - started
+            self.report.count += 1
+            self.report.shapes[normalize_sql(sql)] += 1
+
+    def __enter__(self) -> QueryCollector:
+        for connection in connections.all():
+            self.stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info: tp.Any) -> None:
+        self.stack.close()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import contextlib
+import random
+import typing as tp
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+# Set by APIView for the duration of a request whose reads may be served by a
+# replica, everything else reads from the primary.
+replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+
+
+def get_replicas() -> list[str]:
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+@contextlib.contextmanager
+def use_replicas(enabled: bool = True) -> tp.Iterator[None]:
+    token = replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        replica_reads.reset(token)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model: type[Model], **hints: tp.Any) -> str | None:
+        replicas = get_replicas()
+        if not replicas or not replica_reads.get():
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model: type[Model], **hints: tp.Any) -> str | None:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: tp.Any) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: tp.Any) -> bool | None:
+        if db in get_replicas():
+            return False
+        return None
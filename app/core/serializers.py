@@ -1,14 +1,183 @@
+import types
 import typing as tp
 
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.query import QuerySet
+
 from app.core.exceptions import ValidationError
 
-from rest_framework import serializers
+from rest_framework import fields, serializers
+from rest_framework.relations import PKOnlyObject
+
+# Fields whose to_representation is exactly one of these builtins get it
+# inlined in the compiled function instead of a method call per value.
+INLINE_CONVERTERS = {
+    fields.CharField.to_representation: str,
+    fields.IntegerField.to_representation: int,
+    fields.FloatField.to_representation: float,
+}
+
+
+def get_converter(field: fields.Field) -> tp.Callable[[tp.Any], tp.Any]:
+    to_representation = type(field).to_representation
+    if (
+        to_representation is fields.UUIDField.to_representation
+        and field.uuid_format == 'hex_verbose'
+    ):
+        return str
+    return INLINE_CONVERTERS.get(to_representation, field.to_representation)
+
+
+def is_plain_attribute(field: fields.Field) -> bool:
+    # Nested serializers are relations, they go through get_attribute() like
+    # related fields do.
+    return (
+        type(field).get_attribute is fields.Field.get_attribute
+        and not isinstance(field, serializers.BaseSerializer)
+        and field.source != '*'
+        and all(attr.isidentifier() for attr in field.source_attrs)
+    )
+
+
+def compile_representation(
+    readable_fields: list[fields.Field],
+    *,
+    from_values: bool,
+) -> tp.Callable[[list[fields.Field]], tp.Callable[[tp.Any], dict[str, tp.Any]]]:
+    # Generates the equivalent of Serializer.to_representation unrolled over
+    # the fields, reading model attributes or the keys of values() rows. The
+    # code is generated once per class, the returned function binds it to the
+    # fields of a serializer instance so method and context dependent fields
+    # see that instance.
+    namespace = {
+        'MethodType': types.MethodType,
+        'ObjectDoesNotExist': ObjectDoesNotExist,
+        'PKOnlyObject': PKOnlyObject,
+        'SKIPPED': object(),
+        'SkipField': fields.SkipField,
+        'get_converter': get_converter,
+    }
+    prelude = ['def bind(fields):']
+    lines = ['    def represent(row):', '        result = {}']
+    for index, field in enumerate(readable_fields):
+        value = f'value{index}'
+        convert = f'convert{index}'
+        prelude.append(f'    {convert} = get_converter(fields[{index}])')
+        name = repr(field.field_name)
+
+        if from_values:
+            lines.append(f'        {value} = row[{"__".join(field.source_attrs)!r}]')
+        elif is_plain_attribute(field) and len(field.source_attrs) == 1:
+            # A missing attribute goes through get_attribute(), which applies
+            # the field's default, allow_null and required like DRF does.
+            prelude.append(f'    get{index} = fields[{index}].get_attribute')
+            lines.extend(
+                [
+                    '        try:',
+                    f'            {value} = row.{field.source_attrs[0]}',
+                    '        except ObjectDoesNotExist:',
+                    f'            {value} = None',
+                    '        except AttributeError:',
+                    '            try:',
+                    f'                {value} = get{index}(row)',
+                    '            except SkipField:',
+                    f'                {value} = SKIPPED',
+                    f'        if {value} is not SKIPPED:',
+                    f'            if type({value}) is MethodType:',
+                    f'                {value} = {value}()',
+                    f'            result[{name}] = None if {value} is None '
+                    f'else {convert}({value})',
+                ]
+            )
+            continue
+        else:
+            prelude.append(f'    get{index} = fields[{index}].get_attribute')
+            lines.extend(
+                [
+                    '        try:',
+                    f'            {value} = get{index}(row)',
+                    '        except SkipField:',
+                    '            pass',
+                    '        else:',
+                    f'            if isinstance({value}, PKOnlyObject):',
+                    f'                result[{name}] = None if {value}.pk is None '
+                    f'else {convert}({value})',
+                    '            else:',
+                    f'                result[{name}] = None if {value} is None '
+                    f'else {convert}({value})',
+                ]
+            )
+            continue
+
+        lines.append(
+            f'        result[{name}] = None if {value} is None else {convert}({value})'
+        )
+
+    lines.extend(['        return result', '    return represent'])
+    exec('\n'.join(prelude + lines), namespace)
+    return namespace['bind']
 
 
 class BaseSerializer(serializers.Serializer):
+    # 'objects' compiles a read-only fast path over model instances, 'values'
+    # one over queryset.values() rows, see represent_many().
+    compile_mode: tp.ClassVar[tp.Literal['objects', 'values'] | None] = None
+
+    values_fields: tp.ClassVar[list[str]] = []
+
+    def __init_subclass__(cls, **kwargs: tp.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.compile_mode is not None:
+            cls.compile()
+
+    @classmethod
+    def compile(cls) -> None:
+        readable_fields = list(cls()._readable_fields)
+        cls._bind_objects = staticmethod(
+            compile_representation(readable_fields, from_values=False)
+        )
+        if cls.compile_mode == 'values':
+            if not all(is_plain_attribute(field) for field in readable_fields):
+                raise TypeError(
+                    f'{cls.__qualname__} can only be compiled from values() rows '
+                    'if all its fields read plain attributes.'
+                )
+            cls.values_fields = [
+                '__'.join(field.source_attrs) for field in readable_fields
+            ]
+            cls._bind_values = staticmethod(
+                compile_representation(readable_fields, from_values=True)
+            )
+
+    @classmethod
+    def represent_many(
+        cls,
+        rows: tp.Iterable[tp.Any],
+        *,
+        context: dict[str, tp.Any] | None = None,
+    ) -> list[dict[str, tp.Any]]:
+        readable_fields = list(cls(context=context or {})._readable_fields)
+        if cls.compile_mode == 'values' and isinstance(rows, QuerySet):
+            represent = cls._bind_values(readable_fields)
+            rows = rows.values(*cls.values_fields)
+        else:
+            represent = cls._bind_objects(readable_fields)
+        return [represent(row) for row in rows]
+
     @tp.override
     def is_valid(self, *, raise_exception=False) -> bool:
         try:
             return super().is_valid(raise_exception=raise_exception)
         except serializers.ValidationError as error:
-            raise ValidationError(error.detail)
\ No newline at end of file
+            raise ValidationError(error.detail)
+
+
+class BatchItemSerializer(BaseSerializer):
+    method = serializers.ChoiceField(choices=['GET', 'POST', 'PUT', 'DELETE'])
+    path = serializers.CharField()
+    body = serializers.JSONField(required=False, default=None)
+
+
+class BatchSerializer(BaseSerializer):
+    requests = BatchItemSerializer(many=True, allow_empty=False)
+    atomic = serializers.BooleanField(default=False)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import typing as tp
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app.core.cache import bump_generation
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_response_cache(
+    sender: type[Model],
+    using: str,
+    **kwargs: tp.Any,
+) -> None:
+    # Every model is bumped, whether a cached view reads it or not, so the
+    # process doing the write needn't know the views. It is one cache incr,
+    # on commit: a reader could otherwise cache the previous rows under the
+    # new generation, or the rows of a transaction that is rolled back.
+    transaction.on_commit(partial(bump_generation, sender), using=using)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+import time
+import typing as tp
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+from django.template.utils import get_app_template_dirs
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompiledTemplate:
+    name: str
+    seconds: float
+    error: str | None = None
+
+
+def iter_template_names(
+    backend: DjangoTemplates,
+    *,
+    include_apps: bool = False,
+) -> tp.Iterator[str]:
+    dirs = [*backend.engine.dirs]
+    if include_apps:
+        dirs += get_app_template_dirs('templates')
+
+    seen = set()
+    for directory in map(Path, dirs):
+        for path in sorted(directory.rglob('*.html')):
+            name = path.relative_to(directory).as_posix()
+            if name not in seen:
+                seen.add(name)
+                yield name
+
+
+def precompile_templates(*, include_apps: bool = False) -> list[CompiledTemplate]:
+    """
+    Loads the project templates once, so the cotton transform and the Django
+    parse are done before the first request. The cached loader keeps the
+    compiled templates for the life of the process.
+
+    Installed apps ship templates for optional features that don't compile
+    without them, their errors are reported instead of raised.
+    """
+    results = []
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+
+        for name in iter_template_names(backend, include_apps=include_apps):
+            started = time.perf_counter()
+            try:
+                backend.get_template(name)
+            except TemplateSyntaxError as error:
+                error_message = str(error).splitlines()[0]
+            else:
+                error_message = None
+            results.append(
+                CompiledTemplate(name, time.perf_counter() - started, error_message)
+            )
+    return results
+
+
+def slowest_first(results: tp.Iterable[CompiledTemplate]) -> list[CompiledTemplate]:
+    return sorted(
+        (result for result in results if result.error is None),
+        key=lambda result: result.seconds,
+        reverse=True,
+    )
+
+
+def warm_up_templates() -> None:
+    # Called by the WSGI and ASGI entry points, before the worker serves its
+    # first request.
+    if not getattr(settings, 'TEMPLATE_WARMUP', False):
+        return
+
+    started = time.perf_counter()
+    results = precompile_templates(include_apps=True)
+    failed = [result for result in results if result.error]
+    for result in failed:
+        logger.debug('Template %s not compiled: %s', result.name, result.error)
+    logger.info(
+        'Compiled %d templates in %.1fms, %d skipped.',
+        len(results) - len(failed),
+        (time.perf_counter() - started) * 1000,
+        len(failed),
+    )
+    for result in slowest_first(results):
+        logger.info('Compiled %s in %.2fms.', result.name, result.seconds * 1000)
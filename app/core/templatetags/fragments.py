@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import typing as tp
+from functools import cache
+
+from django import template
+from django.template.base import FilterExpression, NodeList, token_kwargs
+from django.template.context import Context
+
+from app.core.fragments import get_fragment_key, get_or_render
+
+register = template.Library()
+
+# Arguments of the tags that configure the cache instead of keying it.
+OPTIONS = ('version', 'scope', 'timeout')
+
+
+def parse_arguments(
+    parser: template.base.Parser,
+    token: template.base.Token,
+) -> tuple[FilterExpression, dict[str, FilterExpression]]:
+    tag_name, *bits = token.split_contents()
+    if not bits:
+        raise template.TemplateSyntaxError(
+            f'{tag_name!r} takes the fragment name as its first argument.'
+        )
+
+    name = parser.compile_filter(bits.pop(0))
+    kwargs = token_kwargs(bits, parser)
+    if bits:
+        raise template.TemplateSyntaxError(
+            f'{tag_name!r} only takes keyword arguments after the name.'
+        )
+    return name, kwargs
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(
+        self,
+        name: FilterExpression,
+        kwargs: dict[str, FilterExpression],
+    ) -> None:
+        self.name = name
+        self.kwargs = kwargs
+
+    def render(self, context: Context) -> str:
+        name = self.name.resolve(context)
+        attrs = {key: value.resolve(context) for key, value in self.kwargs.items()}
+        options = {key: attrs.pop(key) for key in OPTIONS if key in attrs}
+        scope = options.get('scope', 'global')
+        user = getattr(context.get('request'), 'user', None)
+        if scope == 'user' and (user is None or not user.is_authenticated):
+            # Anonymous visitors have no per user entry, they get the block
+            # rendered uncached.
+            return self.render_fragment(context, name, attrs)
+
+        key = get_fragment_key(
+            name,
+            attrs,
+            version=options.get('version'),
+            scope=scope,
+            user=user,
+        )
+        return get_or_render(
+            key,
+            lambda: self.render_fragment(context, name, attrs),
+            timeout=options.get('timeout'),
+        )
+
+    def render_fragment(
+        self,
+        context: Context,
+        name: str,
+        attrs: dict[str, tp.Any],
+    ) -> str:
+        raise NotImplementedError
+
+
+class FragmentNode(FragmentCacheNode):
+    def __init__(
+        self,
+        nodelist: NodeList,
+        name: FilterExpression,
+        kwargs: dict[str, FilterExpression],
+    ) -> None:
+        super().__init__(name, kwargs)
+        self.nodelist = nodelist
+
+    @tp.override
+    def render_fragment(
+        self,
+        context: Context,
+        name: str,
+        attrs: dict[str, tp.Any],
+    ) -> str:
+        return self.nodelist.render(context)
+
+
+class ComponentNode(FragmentCacheNode):
+    @tp.override
+    def render_fragment(
+        self,
+        context: Context,
+        name: str,
+        attrs: dict[str, tp.Any],
+    ) -> str:
+        component = compile_component(context.template.engine, name, tuple(attrs))
+        with context.push(fragment_attrs=attrs):
+            return component.render(context)
+
+
+@cache
+def compile_component(
+    engine: template.Engine,
+    name: str,
+    keys: tuple[str, ...],
+) -> template.Template:
+    # Compiled once per component and attribute names, the values are bound
+    # at render time from the context.
+    attrs = ' '.join(f':{key}="fragment_attrs.{key}"' for key in keys)
+    return engine.from_string(f'{{% cotton {name} {attrs} %}}{{% endcotton %}}')
+
+
+@register.tag
+def fragment(parser: template.base.Parser, token: template.base.Token) -> FragmentNode:
+    """
+    Caches the rendered block, keyed by its name, keyword arguments, an
+    optional version and scope='user' to cache it per authenticated user,
+    anonymous visitors get it rendered uncached:
+
+        {% fragment 'account-menu' version=2 scope='user' %}...{% endfragment %}
+
+    Forms must not be cached this way, the cached csrf_token would be served
+    to other sessions or outlive its rotation on login.
+    """
+    name, kwargs = parse_arguments(parser, token)
+    nodelist = parser.parse(('endfragment',))
+    parser.delete_first_token()
+    return FragmentNode(nodelist, name, kwargs)
+
+
+@register.tag
+def cached_component(
+    parser: template.base.Parser,
+    token: template.base.Token,
+) -> ComponentNode:
+    """
+    Renders and caches a cotton component, the keyword arguments are both its
+    attributes and the cache key:
+
+        {% cached_component 'input.primary' name='email' type='email' %}
+    """
+    name, kwargs = parse_arguments(parser, token)
+    return ComponentNode(name, kwargs)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import dataclasses
+
+from django.http import HttpResponse
+
+import pytest
+
+
+def assert_query_budget(response: HttpResponse, budget: int | None = None) -> None:
+    report = getattr(response, 'query_report', None)
+    if report is None:
+        pytest.fail(
+            'The response was not produced by an instrumented APIView, '
+            'async views are not instrumented.'
+        )
+
+    if budget is not None:
+        report = dataclasses.replace(report, budget=budget)
+
+    if report.exceeds_budget:
+        pytest.fail(f'Query budget exceeded: {report.describe()}')
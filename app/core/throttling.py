@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+import typing as tp
+
+from django.conf import settings
+from django.core.cache import caches
+
+from app.core.exceptions import Throttled
+
+if tp.TYPE_CHECKING:
+    from app.core.views import APIView
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    limit, period = rate.split('/')
+    return int(limit), PERIODS[period[0]]
+
+
+def get_throttle_cache():
+    return caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+
+
+def client_ip(view: APIView) -> str | None:
+    return view.request.META.get('REMOTE_ADDR')
+
+
+def data_field(name: str) -> tp.Callable[[APIView], str | None]:
+    def get_field(view: APIView) -> str | None:
+        value = view.data.get(name)
+        if not isinstance(value, str) or not value:
+            return None
+        return value.strip().lower()
+
+    return get_field
+
+
+class Throttle:
+    """
+    Sliding window limiter: the count of the previous fixed window, weighted
+    by how much of it still overlaps the sliding window, plus the count of
+    the current one. Counters live in the shared cache and are bumped with
+    add/incr, which are atomic on the Redis and Memcached backends.
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        *,
+        rate: str,
+        key: tp.Callable[[APIView], str | None] = client_ip,
+    ) -> None:
+        self.scope = scope
+        self.rate = rate
+        self.key = key
+
+    def get_rate(self) -> tuple[int, int]:
+        rates = getattr(settings, 'THROTTLE_RATES', {})
+        return parse_rate(rates.get(self.scope, self.rate))
+
+    def get_cache_key(self, ident: str, window: int) -> str:
+        digest = hashlib.md5(ident.encode(), usedforsecurity=False).hexdigest()
+        return f'throttle:{self.scope}:{digest}:{window}'
+
+    def hit(self, ident: str, now: float | None = None) -> float | None:
+        limit, period = self.get_rate()
+        now = time.time() if now is None else now
+        window, offset = divmod(now, period)
+        elapsed = offset / period
+
+        cache = get_throttle_cache()
+        key = self.get_cache_key(ident, int(window))
+        cache.add(key, 0, timeout=period * 2)
+        try:
+            current = cache.incr(key)
+        except ValueError:
+            # Evicted between add and incr.
+            cache.set(key, 1, timeout=period * 2)
+            current = 1
+        previous = cache.get(self.get_cache_key(ident, int(window) - 1), 0)
+
+        if previous * (1 - elapsed) + current <= limit:
+            return None
+
+        return self.get_retry_after(limit, period, elapsed, previous, current)
+
+    def get_retry_after(
+        self,
+        limit: int,
+        period: int,
+        elapsed: float,
+        previous: int,
+        current: int,
+    ) -> float:
+        # Time until the estimate falls back under the limit without new hits.
+        if current < limit:
+            return (1 - (limit - current) / previous - elapsed) * period
+        return (1 - elapsed + 1 - limit / current) * period
+
+    def check(self, view: APIView) -> None:
+        ident = self.key(view)
+        if ident is None:
+            return
+
+        retry_after = self.hit(ident)
+        if retry_after is not None:
+            raise Throttled(retry_after=math.ceil(retry_after))
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+import typing as tp
+from collections import defaultdict
+from time import perf_counter_ns
+
+
+class Phase:
+    __slots__ = ('timer', 'name', 'started')
+
+    def __init__(self, timer: PhaseTimer, name: str) -> None:
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started = perf_counter_ns()
+
+    def __exit__(self, *exc_info: tp.Any) -> None:
+        self.timer.record(self.name, perf_counter_ns() - self.started)
+
+
+class NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: tp.Any) -> None:
+        pass
+
+
+NULL_PHASE = NullPhase()
+
+
+class PhaseTimer:
+    __slots__ = ('phases',)
+
+    def __init__(self) -> None:
+        self.phases: dict[str, int] = {}
+
+    def phase(self, name: str) -> Phase:
+        return Phase(self, name)
+
+    def record(self, name: str, duration_ns: int) -> None:
+        # A phase entered several times (one serialization per chunk) adds up.
+        self.phases[name] = self.phases.get(name, 0) + duration_ns
+
+    def to_header(self) -> str:
+        return ', '.join(
+            f'{name};dur={duration / 1_000_000:.3f}'
+            for name, duration in self.phases.items()
+        )
+
+
+class Histogram:
+    # Bucket i counts durations in [2**(i-1), 2**i) nanoseconds, the last one
+    # everything above.
+    BUCKETS = 40
+    LIMIT = 1 << (BUCKETS - 1)
+
+    __slots__ = ('buckets', 'total_ns')
+
+    def __init__(self) -> None:
+        self.buckets = [0] * self.BUCKETS
+        self.total_ns = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets)
+
+    def record(self, duration_ns: int) -> None:
+        if duration_ns < self.LIMIT:
+            self.buckets[duration_ns.bit_length()] += 1
+        else:
+            self.buckets[-1] += 1
+        self.total_ns += duration_ns
+
+    def snapshot(self) -> dict[str, tp.Any]:
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1_000_000,
+            'buckets_us': {
+                (1 << index) / 1000: count
+                for index, count in enumerate(self.buckets)
+                if count
+            },
+        }
+
+
+class PhaseHistograms:
+    def __init__(self) -> None:
+        self.histograms: defaultdict[tuple[str, str], Histogram] = defaultdict(
+            Histogram
+        )
+        self.lock = threading.Lock()
+
+    def record(self, view: str, phases: dict[str, int]) -> None:
+        with self.lock:
+            for name, duration in phases.items():
+                self.histograms[(view, name)].record(duration)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, tp.Any]]]:
+        snapshot: dict[str, dict[str, dict[str, tp.Any]]] = defaultdict(dict)
+        with self.lock:
+            for (view, name), histogram in self.histograms.items():
+                snapshot[view][name] = histogram.snapshot()
+        return dict(snapshot)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.histograms.clear()
+
+
+histograms = PhaseHistograms()
@@ -0,0 +1,16 @@
+from django.urls import path
+
+from app.core import views
+
+urlpatterns = [
+    path(
+        'api/batch/',
+        views.BatchAPIView.as_view(),
+        name='batch',
+    ),
+    path(
+        'internal/db/',
+        views.DatabaseStatsView.as_view(),
+        name='database_stats',
+    ),
+]
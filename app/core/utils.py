@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models.query import QuerySet
+from django.db.utils import IntegrityError
 
 from app.core.exceptions import ObjectDoesNotExist
 
 if TYPE_CHECKING:
     from app.core.types import DjangoModelType
 
+SQLITE_CONSTRAINT_NAME = re.compile(r"constraint failed: index '([^']+)'")
+
+
+def get_queryset(
+    model_or_queryset: type[DjangoModelType] | QuerySet[DjangoModelType],
+) -> QuerySet[DjangoModelType]:
+    if isinstance(model_or_queryset, QuerySet):
+        return model_or_queryset
+    return model_or_queryset.objects.all()
+
 
 def get_object_or_404(
     model_or_queryset: type[DjangoModelType] | QuerySet[DjangoModelType],
@@ -16,9 +30,39 @@ def get_object_or_404(
     pk: str,
     error_details: str | None = None,
 ) -> DjangoModelType:
-    if issubclass(model_or_queryset, DjangoModelType):
-        model_or_queryset = model_or_queryset.objects.all()
+    queryset = get_queryset(model_or_queryset)
+    try:
+        return queryset.get(pk=pk)
+    except queryset.model.DoesNotExist:
+        raise ObjectDoesNotExist(error_details)
+
+
+async def aget_object_or_404(
+    model_or_queryset: type[DjangoModelType] | QuerySet[DjangoModelType],
+    *,
+    pk: str,
+    error_details: str | None = None,
+) -> DjangoModelType:
+    queryset = get_queryset(model_or_queryset)
     try:
-        return model_or_queryset.get(pk=pk)
-    except model_or_queryset.DoesNotExist:
+        return await queryset.aget(pk=pk)
+    except queryset.model.DoesNotExist:
         raise ObjectDoesNotExist(error_details)
+
+
+def get_violated_constraint(error: IntegrityError) -> str | None:
+    # psycopg exposes the constraint name, SQLite only names expression
+    # indexes in the message.
+    diag = getattr(error.__cause__, 'diag', None)
+    if diag is not None:
+        return diag.constraint_name
+
+    match = SQLITE_CONSTRAINT_NAME.search(str(error))
+    return match.group(1) if match else None
+
+
+def get_error_dict(error: DjangoValidationError) -> dict[str, list[str]]:
+    # message_dict only exists for errors raised with a dict.
+    if hasattr(error, 'error_dict'):
+        return error.message_dict
+    return {NON_FIELD_ERRORS: error.messages}
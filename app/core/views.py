@@ -1,36 +1,80 @@
 from __future__ import annotations, unicode_literals
 
-import json
+import calendar
+import hashlib
+import io
+import itertools
 import logging
 import typing as tp
+from functools import partial
+from http.cookies import SimpleCookie
+from urllib.parse import SplitResult, urlsplit
 
-from django.contrib.auth.mixins import LoginRequiredMixin
+from django.conf import settings
+from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.db.models import Count, Max, Prefetch
 from django.db.models.query import QuerySet
 from django.forms import ValidationError as DjangoValidationError
-from django.http import HttpRequest, JsonResponse, QueryDict
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    QueryDict,
+    StreamingHttpResponse,
+)
 from django.template.response import TemplateResponse
+from django.urls import Resolver404, resolve
+from django.utils.cache import get_conditional_response, patch_vary_headers
 from django.utils.decorators import method_decorator
+from django.utils.http import http_date
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import TemplateView
 from django.views.generic.detail import DetailView
 
-from app.core.exceptions import APIError, ValidationError
+from app.core import codecs
+from app.core.cache import ResponseCache
+from app.core.db import get_connection_stats
+from app.core.exceptions import (
+    APIError,
+    ObjectDoesNotExist,
+    PayloadTooLarge,
+    ValidationError,
+)
+from app.core.forms import BaseForm
+from app.core.pagination import CursorPage
+from app.core.queries import QueryCollector, QueryReport
+from app.core.routers import use_replicas
+from app.core.serializers import BatchSerializer
+from app.core.throttling import Throttle
+from app.core.timing import NULL_PHASE, Phase, PhaseTimer, histograms
 from app.core.types import (
     AuthenticatedRequest,
     DjangoFilterType,
     DjangoModelType,
     DRFSerializerType,
 )
-from app.core.utils import get_object_or_404
+from app.core.utils import (
+    aget_object_or_404,
+    get_error_dict,
+    get_object_or_404,
+    get_queryset,
+)
 
+from asgiref.sync import async_to_sync, sync_to_async
 from rest_framework.exceptions import ValidationError as DRFValidationError
 
 logger = logging.getLogger(__name__)
 
 HTTPMethod = tp.Literal['post', 'get', 'put', 'delete']
 
-Response = JsonResponse | TemplateResponse
+Response = HttpResponse | StreamingHttpResponse | TemplateResponse
+
+SAFE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+READ_PRIMARY_COOKIE = 'read_primary'
 
 
 class BaseView(View):
@@ -48,22 +92,94 @@ class APIView(BaseView):
     model: type[DjangoModelType] | None = None
     queryset: QuerySet[DjangoModelType] | None = None
     pk_url_kwarg = 'pk'
+    # Applied to get_object() and to the filtered and paginated querysets.
+    select_related: tp.Sequence[str] = ()
+    prefetch_related: tp.Sequence[str | Prefetch] = ()
+    only_fields: tp.Sequence[str] = ()
+    defer_fields: tp.Sequence[str] = ()
     template_engine: str = 'django'
+    stream_chunk_size: int = 2000
+    # None falls back to DATA_UPLOAD_MAX_MEMORY_SIZE.
+    max_body_size: int | None = None
+    # Leave JSON bodies unparsed so the handler can consume a top-level array
+    # item by item with iter_json_items.
+    stream_json_body: bool = False
+    body_chunk_size: int = 64 * 1024
+    # Opt-in ETag and Last-Modified from this field, probed with one extra
+    # query per GET, e.g. 'updated_at'.
+    last_modified_field: str | None = None
+    response_cache: ResponseCache | None = None
+    query_budget: int | None = None
+    throttles: tp.Sequence[Throttle] = ()
+    timer: PhaseTimer | None = None
 
     request: HttpRequest
     object: DjangoModelType | None = None
+    validators: tuple[str, int] | None = None
     data: tp.Mapping[str, tp.Any] | QueryDict
     kwargs: tp.Mapping[str, tp.Any]
 
+    def get_max_body_size(self) -> int | None:
+        if self.max_body_size is not None:
+            return self.max_body_size
+        return settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+
+    def get_content_length(self) -> int:
+        try:
+            return int(self.request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return 0
+
+    def check_body_size(self) -> None:
+        limit = self.get_max_body_size()
+        if limit is not None and self.get_content_length() > limit:
+            raise PayloadTooLarge()
+
+    def read_body(self) -> tp.Callable[[int], bytes]:
+        limit = self.get_max_body_size()
+        received = 0
+
+        # The declared length can't be trusted for chunked uploads, so the
+        # limit is enforced again on the bytes actually read.
+        def read(size: int) -> bytes:
+            nonlocal received
+            chunk = self.request.read(size)
+            received += len(chunk)
+            if limit is not None and received > limit:
+                raise PayloadTooLarge()
+            return chunk
+
+        return read
+
+    def iter_json_items(self) -> tp.Iterator[tp.Any]:
+        self.check_body_size()
+        try:
+            yield from codecs.iter_array(
+                self.read_body(),
+                chunk_size=self.body_chunk_size,
+            )
+        except codecs.DecodeError as error:
+            logger.exception(error)
+            raise APIError(
+                status_code=400,
+                details=self.error_dict(str(error)),
+            )
+
     def parse_json_body(self) -> dict[str, tp.Any]:
-        if self.request.body == b'':
+        self.check_body_size()
+        # Read through read_body() rather than request.body, which enforces
+        # DATA_UPLOAD_MAX_MEMORY_SIZE over the view's own max_body_size.
+        read = partial(self.read_body(), self.body_chunk_size)
+        body = b''.join(iter(read, b''))
+
+        if body == b'':
             return {}
 
         try:
-            data = json.loads(self.request.body.decode())
+            data = codecs.loads(body)
             return data
 
-        except json.JSONDecodeError as error:
+        except codecs.DecodeError as error:
             logger.exception(error)
             raise APIError(
                 status_code=400,
@@ -83,67 +199,337 @@ class APIView(BaseView):
 
         return serializer.validated_data
 
-    def get_filtered_queryset(
+    def get_cleaned_data(
         self,
-        filter_class: type[DjangoFilterType],
-        queryset: QuerySet[DjangoFilterType],
+        form_class: type[BaseForm],
+        *,
+        partial: bool = False,
+    ) -> dict[str, tp.Any]:
+        form = form_class(data=self.data, request=self.request)
+        if partial:
+            # Fields left out of the request are neither required nor returned.
+            for name in list(form.fields):
+                if name not in self.data:
+                    del form.fields[name]
+        form.is_valid()
+        return form.cleaned_data
+
+    def shape_queryset(
+        self,
+        queryset: QuerySet[DjangoModelType],
     ) -> QuerySet[DjangoModelType]:
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only_fields:
+            queryset = queryset.only(*self.only_fields)
+        if self.defer_fields:
+            queryset = queryset.defer(*self.defer_fields)
+        return queryset
+
+    def get_queryset(self) -> QuerySet[DjangoModelType] | None:
+        if self.queryset is None and self.model is None:
+            return None
+
+        return self.shape_queryset(
+            get_queryset(self.queryset if self.queryset is not None else self.model)
+        )
+
+    def get_filter(
+        self,
+        filter_class: type[DjangoFilterType],
+        queryset: QuerySet[DjangoModelType],
+    ) -> DjangoFilterType:
         filter = filter_class(
             data=self.data,
-            queryset=queryset,
+            queryset=self.shape_queryset(queryset),
         )
         filter.is_valid(raise_exception=True)
-        return filter.qs
+        return filter
+
+    def get_filtered_queryset(
+        self,
+        filter_class: type[DjangoFilterType],
+        queryset: QuerySet[DjangoModelType],
+    ) -> QuerySet[DjangoModelType]:
+        return self.get_filter(filter_class, queryset).qs
+
+    def get_paginated_queryset(
+        self,
+        filter_class: type[DjangoFilterType],
+        queryset: QuerySet[DjangoModelType],
+    ) -> CursorPage:
+        return self.get_filter(filter_class, queryset).paginate(
+            cursor=self.data.get('cursor'),
+            page_size=self.data.get('page_size'),
+        )
+
+    def get_serializer_context(self) -> dict[str, tp.Any]:
+        # Views can serialize outside of a request cycle, e.g. in tests.
+        return {'request': getattr(self, 'request', None), 'view': self}
 
     def get_serialized_queryset(
         self,
         serializer_class: type[DRFSerializerType],
         queryset: QuerySet[DjangoModelType],
+    ) -> list[dict[str, tp.Any]]:
+        context = self.get_serializer_context()
+        with self.time_phase('serialize'):
+            if getattr(serializer_class, 'compile_mode', None) is not None:
+                return serializer_class.represent_many(queryset, context=context)
+
+            serializer = serializer_class(queryset, many=True, context=context)
+            return serializer.data
+
+    def get_serialized_page(
+        self,
+        serializer_class: type[DRFSerializerType],
+        page: CursorPage,
     ) -> dict[str, tp.Any]:
-        serializer = serializer_class(queryset, many=True)
-        return serializer.data
+        return {
+            'results': self.get_serialized_queryset(serializer_class, page.object_list),
+            'next': page.next_cursor,
+            'previous': page.previous_cursor,
+        }
+
+    def iter_serialized_queryset(
+        self,
+        serializer_class: type[DRFSerializerType],
+        queryset: QuerySet[DjangoModelType],
+    ) -> tp.Iterator[bytes]:
+        yield b'['
+        separator = b''
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        for chunk in itertools.batched(rows, self.stream_chunk_size):
+            yield separator + self.encode_serialized_chunk(serializer_class, chunk)
+            separator = b','
+        yield b']'
+
+    def encode_serialized_chunk(
+        self,
+        serializer_class: type[DRFSerializerType],
+        rows: tp.Sequence[DjangoModelType],
+    ) -> bytes:
+        encoded = codecs.dumps(self.get_serialized_queryset(serializer_class, rows))
+        # Drop the brackets of the chunk list, the array is opened and closed
+        # only once around the whole stream.
+        return encoded[1:-1]
 
     def get_request_data(self) -> tp.Mapping[str, tp.Any] | QueryDict:
         if self.request.method in ['GET']:
             return self.request.GET
 
         if self.request.content_type == 'application/json':
+            if self.stream_json_body:
+                return self.request.GET
             return self.parse_json_body()
 
         return self.request.POST | self.request.FILES
 
     @tp.override
     def get_object(self) -> DjangoModelType | None:
-        if self.queryset or self.model:
-            return get_object_or_404(
-                self.queryset or self.model,
-                pk=self.kwargs.get(self.pk_url_kwarg),
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        queryset = self.get_queryset()
+        if pk is None or queryset is None:
+            return None
+
+        return get_object_or_404(queryset, pk=pk)
+
+    def get_conditional_validators(self) -> tuple[str, int] | None:
+        if self.last_modified_field is None:
+            return None
+        if self.queryset is None and self.model is None:
+            return None
+
+        queryset = get_queryset(
+            self.queryset if self.queryset is not None else self.model
+        )
+        field_names = {field.name for field in queryset.model._meta.concrete_fields}
+        if self.last_modified_field not in field_names:
+            return None
+
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        if pk is not None:
+            last_modified = (
+                queryset.filter(pk=pk)
+                .values_list(self.last_modified_field, flat=True)
+                .first()
+            )
+            count = 1
+        else:
+            # A list changes when a row is updated (max) or deleted (count).
+            probe = queryset.aggregate(
+                last_modified=Max(self.last_modified_field),
+                count=Count('pk'),
             )
+            last_modified, count = probe['last_modified'], probe['count']
+
+        if last_modified is None:
+            return None
 
-        return None
+        # The cache generations also move on deletes and on writes to the
+        # models the view depends on.
+        generations = (
+            self.response_cache.get_generations(self)
+            if self.response_cache is not None
+            else []
+        )
+        # Responses can depend on the user, so the tag is scoped to the
+        # session as well as to the url.
+        session_key = self.request.COOKIES.get(settings.SESSION_COOKIE_NAME, '')
+        key = (
+            f'{self.request.get_full_path()}:{session_key}:'
+            f'{last_modified.isoformat()}:{count}:{generations}'
+        )
+        etag = f'W/"{hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()}"'
+        return etag, calendar.timegm(last_modified.utctimetuple())
+
+    def get_not_modified_response(self) -> HttpResponse | None:
+        if self.request.method not in ['GET', 'HEAD']:
+            return None
+
+        self.validators = self.get_conditional_validators()
+        if self.validators is None:
+            return None
+
+        etag, last_modified = self.validators
+        return get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def set_conditional_headers(self, response: Response) -> None:
+        if self.validators is None or response.status_code not in [200, 304]:
+            return
+
+        etag, last_modified = self.validators
+        response.headers.setdefault('ETag', etag)
+        response.headers.setdefault('Last-Modified', http_date(last_modified))
+        patch_vary_headers(response, ['Cookie'])
+
+    def get_response(self, *args: tp.Any, **kwargs: tp.Any) -> Response:
+        with self.time_phase('conditional'):
+            response = self.get_not_modified_response()
+        if response is None:
+            with self.time_phase('object'):
+                self.object = self.get_object()
+            with self.time_phase('handler'):
+                response = super().dispatch(*args, **kwargs)
+        self.set_conditional_headers(response)
+        return response
+
+    def use_response_cache(self) -> bool:
+        return self.response_cache is not None and self.request.method == 'GET'
+
+    def report_queries(self, response: Response, report: QueryReport) -> None:
+        response.query_report = report
+        if settings.DEBUG:
+            response.headers['X-DB-Queries'] = report.to_header()
+
+        if report.exceeds_budget:
+            logger.error(
+                '%s exceeded its query budget: %s',
+                type(self).__qualname__,
+                report.describe(),
+            )
+        elif report.repeated and not settings.DEBUG:
+            logger.warning(
+                '%s repeated queries: %s',
+                type(self).__qualname__,
+                report.describe(),
+            )
+
+    def time_phase(self, name: str) -> Phase:
+        if self.timer is None:
+            return NULL_PHASE
+        return self.timer.phase(name)
+
+    def report_timings(self, response: Response) -> None:
+        view = f'{type(self).__module__}.{type(self).__qualname__}'
+        histograms.record(view, self.timer.phases)
+        if getattr(settings, 'SERVER_TIMING', settings.DEBUG):
+            response.headers['Server-Timing'] = self.timer.to_header()
 
     @tp.override
-    def dispatch(self, *args: tp.Any, **kwargs: tp.Any) -> JsonResponse:
-        try:
-            self.data = self.get_request_data()
-            self.object = self.get_object()
-            response = super().dispatch(*args, **kwargs)
-        except Exception as exc:
-            response = self.handle_exception(exc)
+    def dispatch(self, *args: tp.Any, **kwargs: tp.Any) -> Response:
+        # Work done while a streaming response is consumed, queries included,
+        # happens after dispatch returns and is not measured.
+        self.timer = PhaseTimer()
+        with self.timer.phase('total'):
+            if getattr(settings, 'QUERY_INSTRUMENTATION', True):
+                with QueryCollector(budget=self.query_budget) as collector:
+                    response = self.handle_request(*args, **kwargs)
+                self.report_queries(response, collector.report)
+            else:
+                response = self.handle_request(*args, **kwargs)
+        self.report_timings(response)
+        return response
+
+    def check_throttles(self) -> None:
+        # Runs before the handler, so rejected requests never reach form
+        # validation or password hashing.
+        for throttle in self.throttles:
+            throttle.check(self)
+
+    def reads_from_replica(self) -> bool:
+        return (
+            self.request.method in SAFE_METHODS
+            and READ_PRIMARY_COOKIE not in self.request.COOKIES
+        )
+
+    def pin_to_primary(self, response: Response) -> None:
+        # Replicas lag behind, the client's next reads go to the primary so it
+        # sees its own writes.
+        if self.request.method in SAFE_METHODS or response.status_code >= 400:
+            return
+
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            '1',
+            max_age=getattr(settings, 'READ_PRIMARY_SECONDS', 5),
+            httponly=True,
+            samesite='Lax',
+        )
+
+    def handle_request(self, *args: tp.Any, **kwargs: tp.Any) -> Response:
+        # Streaming responses are consumed after this returns, their queries
+        # read from the primary.
+        with use_replicas(self.reads_from_replica()):
+            try:
+                with self.time_phase('data'):
+                    self.data = self.get_request_data()
+                if self.throttles:
+                    with self.time_phase('throttle'):
+                        self.check_throttles()
+                if self.use_response_cache():
+                    response = self.response_cache.get_or_set(
+                        self,
+                        lambda: self.get_response(*args, **kwargs),
+                    )
+                else:
+                    response = self.get_response(*args, **kwargs)
+            except Exception as exc:
+                response = self.handle_exception(exc)
+        self.pin_to_primary(response)
         return response
 
     # TODO: check if the request was an API or Template before returning the response
-    def handle_exception(self, exception: Exception) -> JsonResponse:
+    def handle_exception(self, exception: Exception) -> HttpResponse:
         if isinstance(exception, APIError):
-            return self.render_to_json(
+            response = self.render_to_json(
                 status_code=exception.status_code,
                 data=self.error_dict(exception.details),
             )
+            for header, value in exception.headers.items():
+                response.headers[header] = value
+            return response
 
         if isinstance(exception, DjangoValidationError):
             return self.render_to_json(
                 status_code=400,
-                data=self.error_dict(exception.error_dict),
+                data=self.error_dict(get_error_dict(exception)),
             )
 
         if isinstance(exception, DRFValidationError):
@@ -163,14 +549,32 @@ class APIView(BaseView):
         *,
         data: dict[str, tp.Any] | None = None,
         status_code: int = 200,
-    ) -> JsonResponse:
+    ) -> HttpResponse:
         if data is None:
             data = {}
 
-        return JsonResponse(
-            data=data,
+        with self.time_phase('render'):
+            content = codecs.dumps(data)
+        return HttpResponse(
+            content=content,
+            status=status_code,
+            content_type='application/json',
+        )
+
+    def render_to_json_stream(
+        self,
+        *,
+        serializer_class: type[DRFSerializerType],
+        queryset: QuerySet[DjangoModelType],
+        status_code: int = 200,
+    ) -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            streaming_content=self.iter_serialized_queryset(
+                serializer_class,
+                queryset,
+            ),
             status=status_code,
-            json_dumps_params={'ensure_ascii': False},
+            content_type='application/json',
         )
 
     def error_dict(
@@ -216,12 +620,166 @@ class APIView(BaseView):
         raise NotImplementedError
 
 
+class AsyncAPIView(APIView):
+    # Bodies above this size are decoded in a worker thread so that big
+    # payloads don't block the event loop.
+    offload_body_size: int = 1024 * 1024
+
+    def __init_subclass__(cls, **kwargs: tp.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The ORM runs on sync_to_async threads, out of reach of the query
+        # collector, a budget would be silently ignored.
+        if cls.query_budget is not None:
+            raise ImproperlyConfigured(
+                f'{cls.__qualname__} sets query_budget, but the queries of async '
+                'views are not collected.'
+            )
+
+    async def aparse_json_body(self) -> dict[str, tp.Any]:
+        if self.get_content_length() > self.offload_body_size:
+            return await sync_to_async(
+                self.parse_json_body,
+                thread_sensitive=False,
+            )()
+
+        return self.parse_json_body()
+
+    async def aget_request_data(self) -> tp.Mapping[str, tp.Any] | QueryDict:
+        if self.request.method in ['GET']:
+            return self.request.GET
+
+        if self.request.content_type == 'application/json':
+            if self.stream_json_body:
+                return self.request.GET
+            return await self.aparse_json_body()
+
+        return await sync_to_async(self.get_request_data)()
+
+    async def aget_object(self) -> DjangoModelType | None:
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        queryset = self.get_queryset()
+        if pk is None or queryset is None:
+            return None
+
+        return await aget_object_or_404(queryset, pk=pk)
+
+    async def aiter_serialized_queryset(
+        self,
+        serializer_class: type[DRFSerializerType],
+        queryset: QuerySet[DjangoModelType],
+    ) -> tp.AsyncIterator[bytes]:
+        yield b'['
+        separator = b''
+        chunk = []
+        async for row in queryset.aiterator(chunk_size=self.stream_chunk_size):
+            chunk.append(row)
+            if len(chunk) == self.stream_chunk_size:
+                yield separator + self.encode_serialized_chunk(serializer_class, chunk)
+                separator = b','
+                chunk = []
+        if chunk:
+            yield separator + self.encode_serialized_chunk(serializer_class, chunk)
+        yield b']'
+
+    def arender_to_json_stream(
+        self,
+        *,
+        serializer_class: type[DRFSerializerType],
+        queryset: QuerySet[DjangoModelType],
+        status_code: int = 200,
+    ) -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            streaming_content=self.aiter_serialized_queryset(
+                serializer_class,
+                queryset,
+            ),
+            status=status_code,
+            content_type='application/json',
+        )
+
+    @tp.override
+    async def get_response(self, *args: tp.Any, **kwargs: tp.Any) -> Response:
+        with self.time_phase('conditional'):
+            response = await sync_to_async(self.get_not_modified_response)()
+        if response is None:
+            with self.time_phase('object'):
+                self.object = await self.aget_object()
+            with self.time_phase('handler'):
+                response = await super(APIView, self).dispatch(*args, **kwargs)
+        self.set_conditional_headers(response)
+        return response
+
+    @tp.override
+    async def dispatch(self, *args: tp.Any, **kwargs: tp.Any) -> Response:
+        # The ORM runs on sync_to_async threads here, out of reach of the
+        # connection wrappers installed by the query collector.
+        self.timer = PhaseTimer()
+        with self.timer.phase('total'):
+            response = await self.handle_request(*args, **kwargs)
+        self.report_timings(response)
+        return response
+
+    @tp.override
+    async def handle_request(self, *args: tp.Any, **kwargs: tp.Any) -> Response:
+        # The context variable is copied into the sync_to_async threads.
+        with use_replicas(self.reads_from_replica()):
+            try:
+                with self.time_phase('data'):
+                    self.data = await self.aget_request_data()
+                if self.throttles:
+                    with self.time_phase('throttle'):
+                        await sync_to_async(self.check_throttles)()
+                if self.use_response_cache():
+                    response = await self.response_cache.aget_or_set(
+                        self,
+                        lambda: self.get_response(*args, **kwargs),
+                    )
+                else:
+                    response = await self.get_response(*args, **kwargs)
+            except Exception as exc:
+                response = self.handle_exception(exc)
+        self.pin_to_primary(response)
+        return response
+
+    @tp.override
+    async def post(self, *args, **kwargs) -> Response:
+        raise NotImplementedError
+
+    @tp.override
+    async def get(self, *args, **kwargs) -> Response:
+        raise NotImplementedError
+
+    @tp.override
+    async def put(self, *args, **kwargs) -> Response:
+        raise NotImplementedError
+
+    @tp.override
+    async def delete(self, *args, **kwargs) -> Response:
+        raise NotImplementedError
+
+
 class CsrfExemptMixin:
     @method_decorator(csrf_exempt)
     def dispatch(self, *args, **kwargs):
         return super().dispatch(*args, **kwargs)
 
 
+class AsyncCsrfExemptMixin:
+    @method_decorator(csrf_exempt)
+    async def dispatch(self, *args, **kwargs):
+        return await super().dispatch(*args, **kwargs)
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    async def dispatch(self, request, *args, **kwargs):
+        # Resolve the lazy user here, handle_no_permission() and the handlers
+        # must not trigger a sync session/user lookup inside the event loop.
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
 class AuthenticatedAPIView(
     LoginRequiredMixin,
     APIView,
@@ -238,6 +796,22 @@ class LoggedOutAPIView(
     pass
 
 
+class AsyncAuthenticatedAPIView(
+    AsyncLoginRequiredMixin,
+    AsyncAPIView,
+    View,
+):
+    request: AuthenticatedRequest
+
+
+class AsyncLoggedOutAPIView(
+    AsyncCsrfExemptMixin,
+    AsyncAPIView,
+    View,
+):
+    pass
+
+
 class AuthenticatedTemplateView(
     LoginRequiredMixin,
     BaseTemplateContextMixin,
@@ -271,3 +845,192 @@ class LoggedOutTemplateView(
     def get_context_data(self, **kwargs) -> dict[str, tp.Any]:
         context = super().get_context_data(**kwargs)
         return context
+
+
+class InternalAPIView(APIView):
+    @tp.override
+    def get_response(self, *args: tp.Any, **kwargs: tp.Any) -> Response:
+        if self.request.META.get('REMOTE_ADDR') not in settings.INTERNAL_IPS:
+            raise ObjectDoesNotExist()
+        return super().get_response(*args, **kwargs)
+
+
+class DatabaseStatsView(InternalAPIView):
+    http_method_names = ['get']
+    query_budget = 0
+
+    def get(self, *args: tp.Any, **kwargs: tp.Any) -> HttpResponse:
+        return self.render_to_json(data=get_connection_stats())
+
+
+class BatchAPIView(APIView):
+    http_method_names = ['post']
+    max_batch_size: int = 20
+
+    # Set by sub-requests, they are replayed on the batch response and sent
+    # with the following sub-requests.
+    response_cookies: SimpleCookie
+
+    def post(self, *args: tp.Any, **kwargs: tp.Any) -> HttpResponse:
+        batch = self.get_validated_input(BatchSerializer)
+        if len(batch['requests']) > self.max_batch_size:
+            raise ValidationError(
+                {'requests': [f'A batch holds at most {self.max_batch_size} requests.']}
+            )
+
+        # Load the session user once for the whole batch, in a sync context so
+        # async sub-views can use it too.
+        self.request.user = async_to_sync(self.request.auser)()
+        self.response_cookies = SimpleCookie()
+        if batch['atomic']:
+            # Uncommitted writes are only visible on the primary.
+            self.response_cookies[READ_PRIMARY_COOKIE] = '1'
+            with transaction.atomic():
+                results, committed = self.run_batch(batch['requests'], atomic=True)
+            del self.response_cookies[READ_PRIMARY_COOKIE]
+        else:
+            results, committed = self.run_batch(batch['requests'], atomic=False)
+
+        response = self.render_to_json(
+            data={'results': results, 'committed': committed},
+        )
+        response.cookies.update(self.response_cookies)
+        return response
+
+    def run_batch(
+        self,
+        items: list[dict[str, tp.Any]],
+        *,
+        atomic: bool,
+    ) -> tuple[list[dict[str, tp.Any]], bool]:
+        results = []
+        failed = False
+        for item in items:
+            if failed:
+                results.append(
+                    {
+                        'status': 424,
+                        'headers': {},
+                        'body': self.error_dict(
+                            'A previous request of the batch failed.'
+                        ),
+                    }
+                )
+                continue
+
+            response = self.run_subrequest(item)
+            results.append(self.encode_subresponse(response))
+            if atomic and response.status_code >= 400:
+                transaction.set_rollback(True)
+                failed = True
+
+        return results, not failed
+
+    def run_subrequest(self, item: dict[str, tp.Any]) -> Response:
+        url = urlsplit(item['path'])
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return self.render_to_json(
+                status_code=404,
+                data=self.error_dict('Not found.'),
+            )
+
+        view_class = getattr(match.func, 'view_class', None)
+        if (
+            view_class is None
+            or not issubclass(view_class, APIView)
+            or issubclass(view_class, BatchAPIView)
+        ):
+            return self.render_to_json(
+                status_code=400,
+                data=self.error_dict('Only API views can be batched.'),
+            )
+
+        request = self.build_subrequest(item, url)
+        request.resolver_match = match
+        try:
+            if view_class.view_is_async:
+                response = async_to_sync(match.func)(
+                    request, *match.args, **match.kwargs
+                )
+            else:
+                response = match.func(request, *match.args, **match.kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.share_state(request, response)
+        return response
+
+    def build_subrequest(
+        self,
+        item: dict[str, tp.Any],
+        url: SplitResult,
+    ) -> HttpRequest:
+        body = b'' if item['body'] is None else codecs.dumps(item['body'])
+        environ = {
+            **self.request.META,
+            'REQUEST_METHOD': item['method'],
+            'PATH_INFO': url.path,
+            'QUERY_STRING': url.query,
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': io.BytesIO(body),
+        }
+        # Only sub-requests with a body are JSON, not the batch's own type.
+        if item['body'] is None:
+            environ.pop('CONTENT_TYPE', None)
+        else:
+            environ['CONTENT_TYPE'] = 'application/json'
+        request = WSGIRequest(environ)
+        request.COOKIES = {
+            **self.request.COOKIES,
+            **{name: morsel.value for name, morsel in self.response_cookies.items()},
+        }
+        # The batch request already went through the middleware, the session,
+        # the user and the CSRF check are shared instead of redone.
+        request.session = self.request.session
+        request.user = self.request.user
+        request.auser = partial(get_batch_user, request)
+        request.csrf_processing_done = True
+        if hasattr(self.request, '_messages'):
+            request._messages = self.request._messages
+        return request
+
+    def share_state(self, request: HttpRequest, response: Response) -> None:
+        # A login or logout in one sub-request is seen by the following ones
+        # and by the middleware processing the batch response.
+        self.request.user = request.user
+        for key in ('CSRF_COOKIE', 'CSRF_COOKIE_NEEDS_UPDATE'):
+            if key in request.META:
+                self.request.META[key] = request.META[key]
+        self.response_cookies.update(response.cookies)
+
+    def encode_subresponse(self, response: Response) -> dict[str, tp.Any]:
+        if isinstance(response, TemplateResponse):
+            response.render()
+        if response.streaming:
+            content = b''.join(response.streaming_content)
+        else:
+            content = response.content
+
+        if not content:
+            body = None
+        elif response.get('Content-Type', '').startswith('application/json'):
+            body = codecs.loads(content)
+        else:
+            body = content.decode(response.charset, errors='replace')
+
+        return {
+            'status': response.status_code,
+            'headers': {
+                name: value
+                for name, value in response.headers.items()
+                if name not in ('Content-Type', 'Content-Length')
+            },
+            'body': body,
+        }
+
+
+async def get_batch_user(request: HttpRequest) -> tp.Any:
+    # Already loaded by the batch, see BatchAPIView.post().
+    return request.user
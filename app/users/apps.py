@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app.users'
+
+    def ready(self) -> None:
+        from app.users import signals  # noqa: F401
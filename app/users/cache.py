@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import typing as tp
+import zlib
+from functools import cache
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+
+if tp.TYPE_CHECKING:
+    from app.users.models import User
+
+
+def get_user_cache():
+    return caches[getattr(settings, 'USER_CACHE_ALIAS', 'default')]
+
+
+@cache
+def get_snapshot_version() -> int:
+    # Snapshots are positional, a schema change must not read older ones.
+    fields = get_user_model().get_snapshot_fields()
+    return zlib.crc32(' '.join(fields).encode())
+
+
+def get_user_cache_key(user_id: tp.Any) -> str:
+    return f'users:snapshot:{get_snapshot_version()}:{user_id}'
+
+
+def invalidate_cached_user(user_id: tp.Any) -> None:
+    get_user_cache().delete(get_user_cache_key(user_id))
+
+
+def invalidate_cached_users(user_ids: tp.Iterable[tp.Any]) -> None:
+    get_user_cache().delete_many([get_user_cache_key(user_id) for user_id in user_ids])
+
+
+def load_user(backend: tp.Any, user_id: tp.Any) -> User | None:
+    User = get_user_model()
+    user_cache = get_user_cache()
+    key = get_user_cache_key(user_id)
+    snapshot = user_cache.get(key)
+    if snapshot is not None:
+        user = User.from_snapshot(snapshot)
+        can_authenticate = getattr(backend, 'user_can_authenticate', None)
+        if can_authenticate is None or can_authenticate(user):
+            return user
+        return None
+
+    user = backend.get_user(user_id)
+    if isinstance(user, User):
+        user_cache.set(
+            key,
+            user.to_snapshot(),
+            timeout=getattr(settings, 'USER_CACHE_TIMEOUT', 300),
+        )
+    return user
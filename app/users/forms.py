@@ -1,12 +1,13 @@
 from typing import override
 
 from django import forms
+from django.http import HttpRequest
 
 from app.core.exceptions import ValidationError
 from app.core.forms import BaseForm
+from app.users.models import User
 
 from allauth.account.forms import LoginForm, SignupForm
-from allauth.account.models import EmailAddress
 
 
 class UserLoginForm(LoginForm):
@@ -27,28 +28,24 @@ class CreateUserForm(BaseForm, SignupForm):
         'password1': 'password',
     }
 
-    def clean_email(self):
-        email = super().clean_email()
-        if EmailAddress.objects.filter(email=email).exists():
-            self.add_error(
-                field='email',
-                error=forms.ValidationError('This email is already in use.'),
-            )
-        return email
-    
-    
+    def validate_unique_email(self, value: str) -> str:
+        # Left to the unique index on lower(email), see UsersManager.
+        self.account_already_exists = False
+        return value
+
     def clean(self):
         cleaned_data = super().clean()
         del cleaned_data['password2']
         return cleaned_data
 
+    def save(self, request: HttpRequest) -> User:
+        return User.objects.create_user(**self.cleaned_data)
 
-class UpdateUserView(BaseForm):
-    first_name = forms.CharField(required=True)
-    last_name = forms.CharField(required=True)
-    birth_date = forms.DateField(required=True)
-    height = forms.FloatField(required=True)
-    weight = forms.FloatField(required=True)
+
+class UpdateUserForm(BaseForm):
+    first_name = forms.CharField(max_length=30)
+    last_name = forms.CharField(max_length=30, required=False)
+    birth_date = forms.DateField(required=False)
 
 
 class EmailVerificationForm(BaseForm): ...
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+import statistics
+import time
+import typing as tp
+
+from django.contrib.auth.hashers import BasePasswordHasher, get_hashers
+from django.core.management.base import BaseCommand, CommandParser
+
+# Work factor attribute per hasher family and whether it scales the cost
+# linearly or as a power of two.
+WORK_FACTORS = (
+    ('iterations', 'linear'),
+    ('time_cost', 'linear'),
+    ('rounds', 'log2'),
+    ('work_factor', 'power2'),
+)
+
+
+def get_work_factor(hasher: BasePasswordHasher) -> tuple[str, str] | None:
+    for attribute, scale in WORK_FACTORS:
+        if hasattr(hasher, attribute):
+            return attribute, scale
+    return None
+
+
+def recommend(value: int, scale: str, ratio: float) -> int:
+    if scale == 'linear':
+        return max(1, round(value * ratio))
+    if scale == 'log2':
+        return max(4, value + round(math.log2(ratio)))
+    return max(2, 2 ** round(math.log2(value * ratio)))
+
+
+def time_hasher(hasher: BasePasswordHasher, samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.encode('calibrate-password', hasher.salt())
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    help = (
+        'Times the configured PASSWORD_HASHERS on this host and recommends '
+        'work factors for a target hashing latency.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--target-ms',
+            type=float,
+            default=100.0,
+            help='Hashing latency to aim for, in milliseconds.',
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=5,
+            help='Hashes timed per hasher, the median is used.',
+        )
+
+    def handle(self, *args: tp.Any, **options: tp.Any) -> None:
+        target = options['target_ms'] / 1000
+        for hasher in get_hashers():
+            work_factor = get_work_factor(hasher)
+            try:
+                duration = time_hasher(hasher, options['samples'])
+            except ValueError as error:
+                self.stderr.write(f'{hasher.algorithm}: skipped, {error}')
+                continue
+
+            if work_factor is None:
+                self.stdout.write(
+                    f'{hasher.algorithm}: {duration * 1000:.1f}ms, '
+                    'no work factor to tune'
+                )
+                continue
+
+            attribute, scale = work_factor
+            current = getattr(hasher, attribute)
+            recommended = recommend(current, scale, target / duration)
+            self.stdout.write(
+                f'{hasher.algorithm}: {duration * 1000:.1f}ms with '
+                f'{attribute}={current}, recommended {attribute}={recommended}'
+            )
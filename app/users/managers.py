@@ -1,38 +1,91 @@
 from __future__ import annotations
 
 import typing as tp
+from dataclasses import dataclass, field
+from functools import partial
 
 from django.contrib.auth.base_user import BaseUserManager
+from django.core.exceptions import FieldDoesNotExist
 from django.db import transaction
 from django.db.utils import IntegrityError
 from django.forms import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+from app.core.cache import bump_generation
+from app.core.utils import get_error_dict, get_violated_constraint
+from app.users.cache import invalidate_cached_users
+from app.users.passwords import hash_passwords
+
 from allauth.account.models import EmailAddress
+from asgiref.sync import sync_to_async
 
 if tp.TYPE_CHECKING:
     from .models import User
 
+EMAIL_IN_USE = _('This email is already in use.')
+
+EMAIL_UNIQUE_CONSTRAINT = 'users_email_ci_unique'
+
+# Changed through their own flows, the email has to stay in sync with its
+# allauth EmailAddress and passwords are hashed.
+NON_UPDATABLE_FIELDS = frozenset({'id', 'email', 'password'})
+
+UNKNOWN_FIELD = _('This field does not exist.')
+
+NON_UPDATABLE_FIELD = _('This field cannot be changed with an update.')
+
+
+@dataclass
+class BulkCreateResult:
+    created: list[User] = field(default_factory=list)
+    # Input row index to the field errors that kept it out.
+    errors: dict[int, dict[str, list[str]]] = field(default_factory=dict)
+
+
+@dataclass
+class BulkUpdateResult:
+    updated: list[User] = field(default_factory=list)
+    # Input row index to the field errors that kept it out.
+    errors: dict[int, dict[str, list[str]]] = field(default_factory=dict)
+
 
 class UsersManager(BaseUserManager):
     model: type[User]
 
-    @transaction.atomic
     def create_user(
         self,
         email: str,
         password: str,
         **extra_fields,
     ) -> User:
+        user = self._build_user(email, **extra_fields)
+        user.set_password(password)
+        self._save_new_user(user)
+        return user
+
+    async def acreate_user(
+        self,
+        email: str,
+        password: str,
+        **extra_fields,
+    ) -> User:
+        user = self._build_user(email, **extra_fields)
+        await user.aset_password(password)
+        await sync_to_async(self._save_new_user)(user)
+        return user
+
+    def _build_user(self, email: str, **extra_fields) -> User:
         if not email:
             raise ValidationError(_('The Email must be set'))
 
         email = self.normalize_email(email).lower()
-        user = self.model(email=email, **extra_fields)
-        user.set_password(password)
+        return self.model(email=email, **extra_fields)
+
+    @transaction.atomic
+    def _save_new_user(self, user: User) -> None:
+        # Hashing happens before, outside of the transaction.
         self._try_save_user(user)
         self._setup_user_email(user)
-        return user
 
     def _setup_user_email(self, user: User) -> None:
         email_address = EmailAddress(
@@ -45,17 +98,225 @@ class UsersManager(BaseUserManager):
         EmailAddress.objects.fill_cache_for_user(user, [email_address])
 
     def _try_save_user(self, user: User) -> None:
+        # Email uniqueness is left to EMAIL_UNIQUE_CONSTRAINT, so saving costs
+        # a single write and no lookups.
+        user.full_clean(validate_unique=False, validate_constraints=False)
         try:
-            user.full_clean()
-            user.save()
-        except IntegrityError as e:
+            with transaction.atomic(using=self.db):
+                user.save(using=self.db)
+        except IntegrityError as error:
+            if get_violated_constraint(error) == EMAIL_UNIQUE_CONSTRAINT:
+                raise ValidationError({'email': [EMAIL_IN_USE]})
+
+            raise ValidationError(_('Error while saving user.'))
+
+    def bulk_create_users(
+        self,
+        rows: tp.Iterable[tp.Mapping[str, tp.Any]],
+        *,
+        batch_size: int = 1000,
+        workers: int | None = None,
+    ) -> BulkCreateResult:
+        result = BulkCreateResult()
+        pending = self._validate_rows(rows, result.errors)
+        self._exclude_taken_emails(pending, result.errors, batch_size=batch_size)
+
+        users = [(index, user) for index, (user, _password) in pending.items()]
+        hashes = hash_passwords(
+            [password for _user, password in pending.values()],
+            workers=workers,
+        )
+        for (_index, user), password in zip(users, hashes):
+            user.password = password
+
+        for start in range(0, len(users), batch_size):
+            chunk = users[start : start + batch_size]
+            try:
+                with transaction.atomic(using=self.db):
+                    created = self.bulk_create([user for _index, user in chunk])
+                    self._bulk_setup_user_emails(created)
+            except IntegrityError:
+                # An email was taken after the check, retry row by row so only
+                # the offending rows are reported.
+                created = self._create_users_one_by_one(chunk, result.errors)
+            result.created += created
+
+        if result.created:
+            transaction.on_commit(
+                partial(bump_generation, self.model),
+                using=self.db,
+            )
+        return result
+
+    def _validate_rows(
+        self,
+        rows: tp.Iterable[tp.Mapping[str, tp.Any]],
+        errors: dict[int, dict[str, list[str]]],
+    ) -> dict[int, tuple[User, str | None]]:
+        pending = {}
+        emails = set()
+        for index, row in enumerate(rows):
+            extra_fields = dict(row)
+            password = extra_fields.pop('password', None)
+            email = self.normalize_email(extra_fields.pop('email', None) or '').lower()
+            user = self.model(email=email, **extra_fields)
+            try:
+                user.full_clean(
+                    exclude=['password'],
+                    validate_unique=False,
+                    validate_constraints=False,
+                )
+            except ValidationError as error:
+                errors[index] = get_error_dict(error)
+                continue
+
+            if email in emails:
+                errors[index] = {'email': [str(EMAIL_IN_USE)]}
+                continue
+
+            emails.add(email)
+            pending[index] = (user, password)
+        return pending
+
+    def _exclude_taken_emails(
+        self,
+        pending: dict[int, tuple[User, str | None]],
+        errors: dict[int, dict[str, list[str]]],
+        *,
+        batch_size: int,
+    ) -> None:
+        indexes = list(pending)
+        for start in range(0, len(indexes), batch_size):
+            chunk = indexes[start : start + batch_size]
+            emails = [pending[index][0].email for index in chunk]
+            taken = set(self.filter(email__in=emails).values_list('email', flat=True))
+            taken.update(
+                EmailAddress.objects.filter(email__in=emails).values_list(
+                    'email', flat=True
+                )
+            )
+            for index in chunk:
+                if pending[index][0].email in taken:
+                    errors[index] = {'email': [str(EMAIL_IN_USE)]}
+                    del pending[index]
+
+    def _bulk_setup_user_emails(self, users: list[User]) -> None:
+        EmailAddress.objects.bulk_create(
+            EmailAddress(
+                user=user,
+                email=user.email,
+                primary=True,
+                verified=False,
+            )
+            for user in users
+        )
+
+    def _create_users_one_by_one(
+        self,
+        chunk: list[tuple[int, User]],
+        errors: dict[int, dict[str, list[str]]],
+    ) -> list[User]:
+        created = []
+        for index, user in chunk:
+            user.pk = None
+            user._state.adding = True
+            try:
+                with transaction.atomic(using=self.db):
+                    user.save(using=self.db)
+                    self._bulk_setup_user_emails([user])
+            except IntegrityError:
+                errors[index] = {'email': [str(EMAIL_IN_USE)]}
+                continue
+            created.append(user)
+        return created
+
+    def update_user(self, user: User, data: tp.Mapping[str, tp.Any]) -> list[str]:
+        # Only the changed columns are written, and nothing at all when the
+        # data matches the loaded user.
+        changed = self._apply_changes(user, data)
+        if changed:
+            self._clean_changes(user, changed)
+            user.save(update_fields=changed)
+        return changed
+
+    def bulk_update_users(
+        self,
+        changes: tp.Iterable[tuple[User, tp.Mapping[str, tp.Any]]],
+        *,
+        batch_size: int = 1000,
+    ) -> BulkUpdateResult:
+        result = BulkUpdateResult()
+        # Users are grouped by the columns that changed, each group is one
+        # bulk_update() that leaves the other columns alone.
+        groups: dict[tuple[str, ...], list[User]] = {}
+        for index, (user, data) in enumerate(changes):
+            try:
+                changed = self._apply_changes(user, data)
+                if changed:
+                    self._clean_changes(user, changed)
+            except ValidationError as error:
+                result.errors[index] = get_error_dict(error)
+                continue
+
+            if changed:
+                groups.setdefault(tuple(sorted(changed)), []).append(user)
+
+        with transaction.atomic(using=self.db):
+            for fields, users in groups.items():
+                self.bulk_update(users, fields, batch_size=batch_size)
+                result.updated += users
+
+        # bulk_update() sends no post_save, the cached snapshots and responses
+        # are invalidated here, like the signal handlers do.
+        if result.updated:
+            user_ids = [user.pk for user in result.updated]
+            invalidate_cached_users(user_ids)
+            transaction.on_commit(
+                partial(invalidate_cached_users, user_ids),
+                using=self.db,
+            )
+            transaction.on_commit(
+                partial(bump_generation, self.model),
+                using=self.db,
+            )
+        return result
+
+    def _apply_changes(self, user: User, data: tp.Mapping[str, tp.Any]) -> list[str]:
+        changed = []
+        for name, value in data.items():
+            # Reported like the field errors, so a bad row doesn't abort a
+            # bulk update.
+            try:
+                model_field = self.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                raise ValidationError({name: [UNKNOWN_FIELD]})
             if (
-                'duplicate key value violates unique constraint "users_email_key"'
-                in str(e)
+                name in NON_UPDATABLE_FIELDS
+                or not model_field.concrete
+                or model_field.many_to_many
             ):
-                raise ValidationError(_('This email is already in use.'))
+                raise ValidationError({name: [NON_UPDATABLE_FIELD]})
 
-            raise ValidationError(_('Error while saving user.'))
+            try:
+                value = model_field.to_python(value)
+            except ValidationError as error:
+                raise ValidationError({name: error.messages})
+
+            if getattr(user, model_field.attname) != value:
+                setattr(user, model_field.attname, value)
+                changed.append(model_field.name)
+        return changed
+
+    def _clean_changes(self, user: User, changed: list[str]) -> None:
+        user.full_clean(
+            exclude=[
+                model_field.name
+                for model_field in self.model._meta.concrete_fields
+                if model_field.name not in changed
+            ],
+            validate_unique=False,
+            validate_constraints=False,
+        )
 
     @transaction.atomic
     def create_superuser(
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import typing as tp
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    load_backend,
+)
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from app.users.cache import load_user
+from app.users.models import User
+
+from asgiref.sync import sync_to_async
+
+
+def verify_session_hash(request: HttpRequest, user: User) -> bool:
+    session_hash = request.session.get(HASH_SESSION_KEY)
+    if not session_hash:
+        return False
+
+    session_auth_hash = user.get_session_auth_hash()
+    if constant_time_compare(session_hash, session_auth_hash):
+        return True
+
+    if any(
+        constant_time_compare(session_hash, fallback_auth_hash)
+        for fallback_auth_hash in user.get_session_auth_fallback_hash()
+    ):
+        request.session.cycle_key()
+        request.session[HASH_SESSION_KEY] = session_auth_hash
+        return True
+
+    return False
+
+
+def get_session_user(request: HttpRequest) -> User | AnonymousUser:
+    # django.contrib.auth.get_user with the user read from the snapshot cache.
+    try:
+        user_id = User._meta.pk.to_python(request.session[SESSION_KEY])
+        backend_path = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return AnonymousUser()
+
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return AnonymousUser()
+
+    user = load_user(load_backend(backend_path), user_id)
+    if user is None:
+        return AnonymousUser()
+
+    if not verify_session_hash(request, user):
+        request.session.flush()
+        return AnonymousUser()
+
+    return user
+
+
+def get_user(request: HttpRequest) -> User | AnonymousUser:
+    if not hasattr(request, '_cached_user'):
+        request._cached_user = get_session_user(request)
+    return request._cached_user
+
+
+async def auser(request: HttpRequest) -> User | AnonymousUser:
+    if not hasattr(request, '_acached_user'):
+        request._acached_user = await sync_to_async(get_user)(request)
+    return request._acached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    @tp.override
+    def process_request(self, request: HttpRequest) -> None:
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(request))
+        request.auser = partial(auser, request)
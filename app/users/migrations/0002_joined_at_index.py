@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(
+                fields=['joined_at', 'id'], name='users_joined_at_id_idx'
+            ),
+        ),
+    ]
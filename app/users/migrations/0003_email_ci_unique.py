@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:02
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_joined_at_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower('email'),
+                name='users_email_ci_unique',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=254, verbose_name='email address'),
+        ),
+    ]
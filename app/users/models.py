@@ -1,15 +1,22 @@
+from __future__ import annotations
+
+import typing as tp
+
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
-from django.db import models
+from django.db import models, router
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
-from app.users.managers import UsersManager
+from app.users import passwords
+from app.users.managers import EMAIL_UNIQUE_CONSTRAINT, UsersManager
 
 
 class User(
     AbstractBaseUser,
     PermissionsMixin,
 ):
-    email = models.EmailField(_('email address'), unique=True)
+    # Unique through the case-insensitive EMAIL_UNIQUE_CONSTRAINT.
+    email = models.EmailField(_('email address'))
     first_name = models.CharField(_('first name'), max_length=30, blank=True)
     last_name = models.CharField(_('last name'), max_length=30, blank=True)
     birth_date = models.DateField(_('birth date'), blank=True, null=True)
@@ -21,6 +28,15 @@ class User(
         verbose_name = _('user')
         verbose_name_plural = _('users')
         db_table = 'users'
+        constraints = [
+            models.UniqueConstraint(
+                Lower('email'),
+                name=EMAIL_UNIQUE_CONSTRAINT,
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['joined_at', 'id'], name='users_joined_at_id_idx'),
+        ]
 
     USERNAME_FIELD = 'email'
     EMAIL_FIELD = 'email'
@@ -29,3 +45,45 @@ class User(
 
     def __str__(self):
         return f'<{self.__class__.__name__} (email="{self.email}")>'
+
+    @classmethod
+    def get_snapshot_fields(cls) -> list[str]:
+        return [field.attname for field in cls._meta.concrete_fields]
+
+    def to_snapshot(self) -> tuple[tp.Any, ...]:
+        return tuple(getattr(self, field) for field in self.get_snapshot_fields())
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tp.Sequence[tp.Any]) -> User:
+        return cls.from_db(
+            router.db_for_read(cls),
+            cls.get_snapshot_fields(),
+            snapshot,
+        )
+
+    def set_password(self, raw_password: str | None) -> None:
+        self.password = passwords.hash_password(raw_password)
+        self._password = raw_password
+
+    async def aset_password(self, raw_password: str | None) -> None:
+        self.password = await passwords.ahash_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password: str | None) -> bool:
+        is_correct, must_update = passwords.verify_password(raw_password, self.password)
+        if is_correct and must_update:
+            self.set_password(raw_password)
+            # Hash upgrades are not password changes.
+            self._password = None
+            self.save(update_fields=['password'])
+        return is_correct
+
+    async def acheck_password(self, raw_password: str | None) -> bool:
+        is_correct, must_update = await passwords.averify_password(
+            raw_password, self.password
+        )
+        if is_correct and must_update:
+            await self.aset_password(raw_password)
+            self._password = None
+            await self.asave(update_fields=['password'])
+        return is_correct
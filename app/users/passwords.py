@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache
+
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.contrib.auth.hashers import make_password
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Pool workers are spawned and unpickle references into this module before
+# Django is set up, so it must not import models.
+
+
+@cache
+def get_executor() -> ThreadPoolExecutor:
+    # The hashlib, bcrypt and argon2 primitives release the GIL, so a few
+    # threads hash in parallel while bounding how many cores a login burst
+    # can take.
+    return ThreadPoolExecutor(
+        max_workers=getattr(settings, 'PASSWORD_HASHING_WORKERS', 4),
+        thread_name_prefix='password-hashing',
+    )
+
+
+def hash_password(password: str | None) -> str:
+    return get_executor().submit(make_password, password).result()
+
+
+def verify_password(password: str | None, encoded: str) -> tuple[bool, bool]:
+    return get_executor().submit(hashers.verify_password, password, encoded).result()
+
+
+async def ahash_password(password: str | None) -> str:
+    return await asyncio.wrap_future(get_executor().submit(make_password, password))
+
+
+async def averify_password(password: str | None, encoded: str) -> tuple[bool, bool]:
+    return await asyncio.wrap_future(
+        get_executor().submit(hashers.verify_password, password, encoded)
+    )
+
+
+@receiver(setting_changed)
+def reset_executor(*, setting: str, **kwargs: tp.Any) -> None:
+    if setting == 'PASSWORD_HASHING_WORKERS':
+        get_executor().shutdown(wait=False)
+        get_executor.cache_clear()
+
+
+def setup_hashing_worker(settings_module: str | None) -> None:
+    if settings_module is not None:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+def hash_passwords(
+    passwords: list[str | None],
+    *,
+    workers: int | None = None,
+) -> list[str]:
+    if workers == 0 or len(passwords) < 2:
+        return [make_password(password) for password in passwords]
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=setup_hashing_worker,
+        initargs=(os.environ.get('DJANGO_SETTINGS_MODULE'),),
+    ) as executor:
+        return list(
+            executor.map(
+                make_password,
+                passwords,
+                chunksize=max(1, len(passwords) // (workers * 4)),
+            )
+        )
@@ -1,12 +1,19 @@
 from app.users import models
+from app.users.managers import BulkCreateResult, BulkUpdateResult
 
 
 def create_user(**kwargs) -> models.User:
     return models.User.objects.create_user(**kwargs)
 
 
-def update_user() -> models.User:
-    pass
+def bulk_create_users(**kwargs) -> BulkCreateResult:
+    return models.User.objects.bulk_create_users(**kwargs)
 
 
-''
+def update_user(*, user: models.User, data: dict) -> models.User:
+    models.User.objects.update_user(user, data)
+    return user
+
+
+def bulk_update_users(**kwargs) -> BulkUpdateResult:
+    return models.User.objects.bulk_update_users(**kwargs)
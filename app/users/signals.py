@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import typing as tp
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app.users.cache import invalidate_cached_user
+from app.users.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_snapshot(instance: User, **kwargs: tp.Any) -> None:
+    # Again on commit, a request reading the row before then would cache the
+    # previous version.
+    invalidate_cached_user(instance.pk)
+    transaction.on_commit(partial(invalidate_cached_user, instance.pk))
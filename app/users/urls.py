@@ -37,7 +37,7 @@ api_urls = [
         name='create_list_users',
     ),
     path(
-        'users/<uuid:pk>/',
+        'users/<int:pk>/',
         views.UserUpdateView.as_view(),
         name='update_detail_users',
     ),
@@ -8,6 +8,8 @@ from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import never_cache
 
+from app.core.exceptions import ObjectDoesNotExist
+from app.core.throttling import Throttle, data_field
 from app.core.views import (
     AuthenticatedAPIView,
     AuthenticatedTemplateView,
@@ -42,6 +44,10 @@ class UserCreateTemplateView(LoggedOutTemplateView):
 
 class UserLoginView(LoggedOutAPIView):
     http_method_names = ['post']
+    throttles = (
+        Throttle('login-ip', rate='30/m'),
+        Throttle('login-email', rate='5/m', key=data_field('login')),
+    )
 
     @method_decorator(never_cache)
     def dispatch(self, *args, **kwargs):
@@ -78,6 +84,10 @@ class UserLogoutView(AuthenticatedAPIView, LogoutFunctionalityMixin):
 
 class UserCreateView(LoggedOutAPIView):
     http_method_names = ['post']
+    throttles = (
+        Throttle('signup-ip', rate='10/m'),
+        Throttle('signup-email', rate='3/m', key=data_field('email')),
+    )
 
     def post(self, *args, **kwargs) -> dict[str, Any]:
         form = forms.CreateUserForm(
@@ -99,7 +109,10 @@ class UserUpdateView(AuthenticatedAPIView):
     http_method_names = ['post']
 
     def post(self, *args, **kwargs) -> dict[str, Any]:
-        data = self.get_cleaned_data(forms.UpdateUserView)
+        if self.kwargs['pk'] != self.request.user.pk:
+            raise ObjectDoesNotExist()
+
+        data = self.get_cleaned_data(forms.UpdateUserForm, partial=True)
         services.update_user(
             user=self.request.user,
             data=data,
@@ -0,0 +1,84 @@
+"""
+Runs the benchmark suites against an in-memory test database and optionally
+stores or compares JSON baselines. Medians are compared, and any benchmark
+slower than its baseline by more than --threshold fails the run.
+
+    python -m benchmarks --save benchmarks/baseline.json
+    python -m benchmarks --compare benchmarks/baseline.json --threshold 0.1
+    python -m benchmarks --suite pipeline --filter views/
+
+benchmarks.uuid_keys reports index sizes on a real database and is run on
+its own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+from benchmarks.base import (
+    compare_results,
+    get_environment,
+    load_results,
+    print_comparisons,
+    print_results,
+    save_results,
+    setup_django,
+    test_database,
+)
+
+SUITES = ('json_codec', 'serializers', 'timing', 'pipeline')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        '--suite', action='append', choices=SUITES, help='defaults to all suites'
+    )
+    parser.add_argument('--filter', default='', help='only keep names containing this')
+    parser.add_argument('--save', type=Path, help='write the results to this file')
+    parser.add_argument('--compare', type=Path, help='baseline file to compare with')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='relative slowdown that fails the comparison',
+    )
+    args = parser.parse_args()
+
+    setup_django()
+
+    results = []
+    with test_database():
+        for suite in args.suite or SUITES:
+            module = importlib.import_module(f'benchmarks.{suite}')
+            results += [result for result in module.run() if args.filter in result.name]
+
+    print_results(results)
+    if args.save:
+        save_results(args.save, results)
+
+    if not args.compare:
+        return 0
+
+    environment, baseline = load_results(args.compare)
+    for key, value in get_environment().items():
+        if environment.get(key) != value:
+            print(f'warning: baseline {key} is {environment.get(key)}, not {value}')
+
+    comparisons = compare_results(baseline, results)
+    print()
+    print_comparisons(comparisons, args.threshold)
+    slower = [
+        comparison for comparison in comparisons if comparison.change > args.threshold
+    ]
+    if slower:
+        print(f'\n{len(slower)} benchmark(s) slower than {args.threshold:.0%}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import platform
+import statistics
+import timeit
+import typing as tp
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import django
+
+
+def setup_django() -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+    django.setup()
+
+
+@contextlib.contextmanager
+def test_database() -> tp.Iterator[None]:
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+        teardown_test_environment,
+    )
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    loops: int
+    best: float
+    median: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1 / self.median
+
+
+def measure(
+    name: str,
+    func: tp.Callable[[], tp.Any],
+    *,
+    repeat: int = 5,
+) -> Result:
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    timings = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+    return Result(
+        name=name,
+        loops=loops,
+        best=min(timings),
+        median=statistics.median(timings),
+    )
+
+
+def print_results(results: tp.Iterable[Result]) -> None:
+    print(f'{"benchmark":<48} {"median":>12} {"best":>12} {"ops/s":>12}')
+    for result in results:
+        print(
+            f'{result.name:<48} '
+            f'{result.median * 1e6:>10.2f}us '
+            f'{result.best * 1e6:>10.2f}us '
+            f'{result.ops_per_sec:>12,.0f}'
+        )
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+
+def get_environment() -> dict[str, str]:
+    from django.conf import settings
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'django': django.get_version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'json_codec': getattr(settings, 'JSON_CODEC', 'auto'),
+    }
+
+
+def save_results(path: Path, results: tp.Iterable[Result]) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                'environment': get_environment(),
+                'results': [asdict(result) for result in results],
+            },
+            indent=2,
+        )
+        + '\n'
+    )
+
+
+def load_results(path: Path) -> tuple[dict[str, str], list[Result]]:
+    data = json.loads(path.read_text())
+    return data['environment'], [Result(**result) for result in data['results']]
+
+
+def compare_results(
+    baseline: tp.Iterable[Result],
+    results: tp.Iterable[Result],
+) -> list[Comparison]:
+    medians = {result.name: result.median for result in baseline}
+    return [
+        Comparison(
+            name=result.name,
+            baseline=medians[result.name],
+            current=result.median,
+        )
+        for result in results
+        if result.name in medians
+    ]
+
+
+def print_comparisons(comparisons: tp.Iterable[Comparison], threshold: float) -> None:
+    print(f'{"benchmark":<48} {"baseline":>12} {"current":>12} {"change":>9}')
+    for comparison in comparisons:
+        flag = '  SLOWER' if comparison.change > threshold else ''
+        print(
+            f'{comparison.name:<48} '
+            f'{comparison.baseline * 1e6:>10.2f}us '
+            f'{comparison.current * 1e6:>10.2f}us '
+            f'{comparison.change:>+8.1%}{flag}'
+        )
@@ -0,0 +1,80 @@
+"""
+Per-request latency of a one-query request with a new connection per request
+(CONN_MAX_AGE = 0), a persistent connection and a psycopg pool. Django's
+request_started/request_finished signals are sent around each request, so
+connections are closed and recycled as under a real server. Needs Postgres,
+e.g. the docker-compose service:
+
+    DJANGO_SETTINGS_MODULE=config.settings.production DJANGO_SECRET_KEY=bench \\
+    POSTGRES_PASSWORD=postgres python -m benchmarks.db_connections
+"""
+
+from __future__ import annotations
+
+import typing as tp
+
+from benchmarks.base import Result, measure, print_results, setup_django
+
+MODES: dict[str, dict[str, tp.Any]] = {
+    'reconnect': {'CONN_MAX_AGE': 0, 'pool': None},
+    'persistent': {'CONN_MAX_AGE': 600, 'pool': None},
+    'pool': {'CONN_MAX_AGE': 0, 'pool': {'min_size': 1, 'max_size': 4}},
+}
+
+
+def configure(connection, mode: dict[str, tp.Any]) -> None:
+    connection.close()
+    if getattr(connection, 'pool', None) is not None:
+        connection.close_pool()
+
+    connection.settings_dict['CONN_MAX_AGE'] = mode['CONN_MAX_AGE']
+    connection.settings_dict['OPTIONS'].pop('pool', None)
+    if mode['pool'] is not None:
+        connection.settings_dict['OPTIONS']['pool'] = mode['pool']
+
+
+def run() -> list[Result]:
+    from django.core.signals import request_finished, request_started
+    from django.db import connection
+
+    def request() -> None:
+        request_started.send(sender=None)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+        request_finished.send(sender=None)
+
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        has_pool = False
+    else:
+        has_pool = True
+
+    results = []
+    for name, mode in MODES.items():
+        if mode['pool'] is not None and not has_pool:
+            print(f'skipping {name}: psycopg[pool] is not installed')
+            continue
+
+        configure(connection, mode)
+        results.append(measure(f'request/{name}', request))
+
+    configure(connection, MODES['reconnect'])
+    return results
+
+
+def main() -> None:
+    setup_django()
+
+    from django.db import connection
+
+    if connection.vendor != 'postgresql':
+        print(f'needs a Postgres database, {connection.vendor} is configured')
+        return
+
+    print_results(run())
+
+
+if __name__ == '__main__':
+    main()
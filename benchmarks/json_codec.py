@@ -0,0 +1,92 @@
+"""
+Compares the JSON codecs from app.core.codecs with the previous
+JsonResponse/json.loads(body.decode()) path on API-shaped payloads.
+
+    python -m benchmarks.json_codec
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import uuid
+
+from benchmarks.base import Result, measure, print_results, setup_django
+
+
+def make_user(index: int) -> dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'email': f'user{index}@example.com',
+        'first_name': 'José',
+        'last_name': 'Conceição',
+        'birth_date': dt.date(1990, 1, 1 + index % 28),
+        'joined_at': dt.datetime(2025, 3, 11, 16, 27, index % 60, tzinfo=dt.UTC),
+        'is_active': index % 7 != 0,
+        'groups': ['staff', 'beta'][: index % 3],
+    }
+
+
+PAYLOADS = {
+    'object': make_user(0),
+    'list-100': {'results': [make_user(index) for index in range(100)]},
+    'list-10k': {'results': [make_user(index) for index in range(10_000)]},
+}
+
+
+def run() -> list[Result]:
+    from django.core.serializers.json import DjangoJSONEncoder
+
+    from app.core.codecs import CODECS
+
+    codecs = []
+    for codec_class in CODECS.values():
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f'skipping {codec_class.name}: backend not installed')
+
+    results = []
+    for payload_name, payload in PAYLOADS.items():
+        body = json.dumps(payload, cls=DjangoJSONEncoder).encode()
+
+        results.append(
+            measure(
+                f'dumps/{payload_name}/jsonresponse',
+                lambda: json.dumps(
+                    payload,
+                    cls=DjangoJSONEncoder,
+                    ensure_ascii=False,
+                ).encode(),
+            )
+        )
+        results.append(
+            measure(
+                f'loads/{payload_name}/decode+json.loads',
+                lambda: json.loads(body.decode()),
+            )
+        )
+        for codec in codecs:
+            results.append(
+                measure(
+                    f'dumps/{payload_name}/{codec.name}',
+                    lambda: codec.dumps(payload),
+                )
+            )
+            results.append(
+                measure(
+                    f'loads/{payload_name}/{codec.name}',
+                    lambda: codec.loads(body),
+                )
+            )
+
+    return results
+
+
+def main() -> None:
+    setup_django()
+    print_results(sorted(run(), key=lambda result: result.name))
+
+
+if __name__ == '__main__':
+    main()
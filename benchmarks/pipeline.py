@@ -0,0 +1,189 @@
+"""
+End to end costs of the request pipeline: APIView.dispatch, parse_json_body
+across payload sizes, BaseSerializer/BaseFilterSet validation,
+UsersManager.create_user and the login and signup views. Runs against a
+throwaway in-memory test database, so it needs no running services.
+
+    python -m benchmarks.pipeline
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+
+from benchmarks.base import Result, measure, print_results, setup_django, test_database
+
+PASSWORD = '123qaz123'
+USERS = 100
+PAYLOAD_SIZES = {'1kb': 1 << 10, '64kb': 1 << 16, '1mb': 1 << 20}
+
+
+def make_payload(size: int) -> bytes:
+    from app.core import codecs
+
+    item = {
+        'email': 'user@example.com',
+        'first_name': 'José',
+        'birth_date': '1990-01-01',
+        'tags': ['staff', 'beta'],
+    }
+    count = max(1, size // len(codecs.dumps(item)))
+    return codecs.dumps({'items': [item] * count})
+
+
+def run() -> list[Result]:
+    from django.test import Client, override_settings
+    from django.test.client import RequestFactory
+    from django.urls import reverse
+
+    from app.core.filters import BaseFilterSet
+    from app.core.serializers import BaseSerializer
+    from app.core.views import APIView
+    from app.users.models import User
+
+    from django_filters import filters
+    from rest_framework import serializers
+
+    class UserSerializer(BaseSerializer):
+        id = serializers.IntegerField()
+        email = serializers.EmailField()
+        first_name = serializers.CharField()
+        joined_at = serializers.DateTimeField()
+
+    class UserInputSerializer(BaseSerializer):
+        email = serializers.EmailField()
+        first_name = serializers.CharField(max_length=255)
+        birth_date = serializers.DateField()
+        is_active = serializers.BooleanField(default=True)
+
+    class UserFilterSet(BaseFilterSet):
+        email = filters.CharFilter(lookup_expr='icontains')
+        joined_after = filters.DateTimeFilter(field_name='joined_at', lookup_expr='gte')
+        is_active = filters.BooleanFilter()
+
+        class Meta:
+            model = User
+            fields = ['email', 'is_active']
+
+    class ListUsersAPIView(APIView):
+        http_method_names = ['get']
+
+        def get(self, request, *args, **kwargs):
+            return self.render_to_json(
+                data=self.get_serialized_queryset(
+                    serializer_class=UserSerializer,
+                    queryset=User.objects.order_by('pk')[:50],
+                )
+            )
+
+    class EchoAPIView(APIView):
+        http_method_names = ['post']
+
+        def post(self, request, *args, **kwargs):
+            return self.render_to_json(data=self.data)
+
+    User.objects.bulk_create(
+        User(
+            email=f'seed{index}@example.com',
+            first_name='Seed',
+            joined_at=dt.datetime(2025, 3, 11, tzinfo=dt.UTC),
+        )
+        for index in range(USERS)
+    )
+    User.objects.create_user(email='login@example.com', password=PASSWORD)
+
+    rf = RequestFactory()
+    emails = (f'bench{index}@example.com' for index in itertools.count())
+    list_view = ListUsersAPIView.as_view()
+    echo_view = EchoAPIView.as_view()
+    echo_request = rf.post('/echo', data={'ok': True}, content_type='application/json')
+
+    results = [
+        measure('dispatch/list-50', lambda: list_view(rf.get('/users'))),
+        measure('dispatch/echo', lambda: echo_view(echo_request)),
+    ]
+
+    for name, size in PAYLOAD_SIZES.items():
+        view = APIView()
+        view.setup(
+            rf.post('/dummy', data=make_payload(size), content_type='application/json')
+        )
+        results.append(measure(f'parse_json_body/{name}', view.parse_json_body))
+
+    user_input = {
+        'email': 'user@example.com',
+        'first_name': 'Test',
+        'birth_date': '1990-01-01',
+    }
+    filter_input = {
+        'email': 'seed1',
+        'joined_after': '2025-01-01T00:00:00Z',
+        'is_active': 'true',
+    }
+    results += [
+        measure(
+            'validate/serializer',
+            lambda: UserInputSerializer(data=user_input).is_valid(raise_exception=True),
+        ),
+        measure(
+            'validate/filterset',
+            lambda: UserFilterSet(
+                data=filter_input, queryset=User.objects.all()
+            ).is_valid(raise_exception=True),
+        ),
+        measure(
+            'users/create_user',
+            lambda: User.objects.create_user(email=next(emails), password=PASSWORD),
+        ),
+    ]
+
+    login_url = reverse('login')
+    signup_url = reverse('create_list_users')
+
+    def login() -> None:
+        response = Client().post(
+            login_url,
+            data={'login': 'login@example.com', 'password': PASSWORD},
+            content_type='application/json',
+        )
+        assert response.status_code == 200, response.content
+
+    def signup() -> None:
+        response = Client().post(
+            signup_url,
+            data={
+                'first_name': 'Test',
+                'email': next(emails),
+                'password1': PASSWORD,
+                'password2': PASSWORD,
+            },
+            content_type='application/json',
+        )
+        assert response.status_code == 201, response.content
+
+    # LOGIN_REDIRECT_URL names a route the template does not ship. The
+    # throttles still run, with limits the loops cannot reach.
+    unlimited = '1000000/s'
+    with override_settings(
+        LOGIN_REDIRECT_URL='profile_template',
+        THROTTLE_RATES={
+            'login-ip': unlimited,
+            'login-email': unlimited,
+            'signup-ip': unlimited,
+            'signup-email': unlimited,
+        },
+    ):
+        results.append(measure('views/login', login))
+        results.append(measure('views/signup', signup))
+    return results
+
+
+def main() -> None:
+    setup_django()
+    with test_database():
+        print_results(run())
+
+
+if __name__ == '__main__':
+    main()
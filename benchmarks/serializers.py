@@ -0,0 +1,85 @@
+"""
+Rows per second of the DRF serializer path against the compiled read-only
+path of BaseSerializer, over model instances and values() style rows.
+
+    python -m benchmarks.serializers
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from benchmarks.base import Result, measure, print_results, setup_django
+
+ROWS = 1_000
+
+
+def run() -> list[Result]:
+    from app.core.serializers import BaseSerializer
+    from app.users.models import User
+
+    from rest_framework import serializers
+
+    class UserSerializer(BaseSerializer):
+        id = serializers.IntegerField()
+        email = serializers.EmailField()
+        first_name = serializers.CharField()
+        last_name = serializers.CharField()
+        birth_date = serializers.DateField()
+        joined_at = serializers.DateTimeField()
+        is_active = serializers.BooleanField()
+
+    class CompiledUserSerializer(UserSerializer):
+        compile_mode = 'objects'
+
+    class ValuesUserSerializer(UserSerializer):
+        compile_mode = 'values'
+
+    users = [
+        User(
+            id=index,
+            email=f'user{index}@example.com',
+            first_name='Test',
+            last_name='User',
+            birth_date=dt.date(1990, 1, 1),
+            joined_at=dt.datetime(2025, 3, 11, 16, 27, tzinfo=dt.UTC),
+            is_active=True,
+        )
+        for index in range(ROWS)
+    ]
+    rows = [
+        {field: getattr(user, field) for field in ValuesUserSerializer.values_fields}
+        for user in users
+    ]
+    represent_values = ValuesUserSerializer._bind_values(
+        list(ValuesUserSerializer()._readable_fields)
+    )
+
+    results = [
+        measure('drf', lambda: UserSerializer(users, many=True).data),
+        measure(
+            'compiled/objects', lambda: CompiledUserSerializer.represent_many(users)
+        ),
+        measure(
+            'compiled/values',
+            lambda: [represent_values(row) for row in rows],
+        ),
+    ]
+    return [
+        Result(
+            name=f'serialize/{ROWS}-rows/{result.name}',
+            loops=result.loops,
+            best=result.best / ROWS,
+            median=result.median / ROWS,
+        )
+        for result in results
+    ]
+
+
+def main() -> None:
+    setup_django()
+    print_results(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Measures the overhead added by the APIView phase timers: a single phase, a
+full request's worth of phases plus the histogram update, and the
+Server-Timing header. Reports the phases whose amortized cost is over
+BUDGET_US.
+
+    python -m benchmarks.timing
+"""
+
+from __future__ import annotations
+
+from benchmarks.base import Result, measure, print_results, setup_django
+
+PHASES = ('total', 'data', 'conditional', 'object', 'handler', 'serialize', 'render')
+BUDGET_US = 5.0
+
+
+def run() -> list[Result]:
+    from app.core.timing import NULL_PHASE, PhaseHistograms, PhaseTimer
+
+    histograms = PhaseHistograms()
+
+    def null_phase() -> None:
+        with NULL_PHASE:
+            pass
+
+    def one_phase() -> None:
+        with PhaseTimer().phase('handler'):
+            pass
+
+    def request() -> None:
+        timer = PhaseTimer()
+        for name in PHASES:
+            with timer.phase(name):
+                pass
+        histograms.record('benchmarks.timing.View', timer.phases)
+
+    def request_with_header() -> None:
+        timer = PhaseTimer()
+        for name in PHASES:
+            with timer.phase(name):
+                pass
+        histograms.record('benchmarks.timing.View', timer.phases)
+        timer.to_header()
+
+    return [
+        measure('timing/null-phase', null_phase),
+        measure('timing/one-phase', one_phase),
+        measure('timing/request', request),
+        measure('timing/request+header', request_with_header),
+    ]
+
+
+def main() -> None:
+    setup_django()
+    results = run()
+    print_results(results)
+    for result in results:
+        per_phase = result.median * 1e6
+        if result.name.startswith('timing/request'):
+            per_phase /= len(PHASES)
+        if per_phase > BUDGET_US:
+            print(f'{result.name}: {per_phase:.2f}us per phase, over {BUDGET_US}us')
+
+
+if __name__ == '__main__':
+    main()
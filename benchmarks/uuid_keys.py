@@ -0,0 +1,99 @@
+"""
+Compares insert throughput and primary key index size of uuid4 and time-ordered
+(UUIDv7) keys on the configured database. Point DJANGO_SETTINGS_MODULE at a
+Postgres database to see the effect of random inserts on the B-tree:
+
+    python -m benchmarks.uuid_keys --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+from benchmarks.base import setup_django
+
+
+def create_table(connection, table: str) -> None:
+    from django.db import models
+
+    id_type = models.UUIDField().db_type(connection)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {table}')
+        cursor.execute(
+            f'CREATE TABLE {table} (id {id_type} PRIMARY KEY, payload varchar(64))'
+        )
+
+
+def get_index_size(connection, table: str) -> int | None:
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'SELECT pg_relation_size(indexrelid) FROM pg_index '
+                'WHERE indrelid = %s::regclass AND indisprimary',
+                [table],
+            )
+            return cursor.fetchone()[0]
+
+        if connection.vendor == 'sqlite':
+            try:
+                cursor.execute(
+                    'SELECT SUM(pgsize) FROM dbstat WHERE name LIKE %s',
+                    [f'sqlite_autoindex_{table}_%'],
+                )
+            except Exception:
+                return None
+            return cursor.fetchone()[0]
+
+    return None
+
+
+def insert_rows(connection, table: str, generator, rows: int, batch: int) -> float:
+    from django.db import models, transaction
+
+    field = models.UUIDField()
+    sql = f'INSERT INTO {table} (id, payload) VALUES (%s, %s)'
+    started = time.perf_counter()
+    for offset in range(0, rows, batch):
+        values = [
+            (field.get_db_prep_value(generator(), connection), f'row {offset + index}')
+            for index in range(min(batch, rows - offset))
+        ]
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.executemany(sql, values)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--batch', type=int, default=1_000)
+    parser.add_argument('--database', default='default')
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connections
+
+    from app.core.ids import uuid7
+
+    connection = connections[args.database]
+    print(f'{connection.vendor}: inserting {args.rows:,} rows per key type')
+    print(f'{"keys":<8} {"rows/s":>12} {"pk index size":>16}')
+    for name, generator in [('uuid4', uuid.uuid4), ('uuid7', uuid7)]:
+        table = f'bench_keys_{name}'
+        create_table(connection, table)
+        try:
+            elapsed = insert_rows(connection, table, generator, args.rows, args.batch)
+            size = get_index_size(connection, table)
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP TABLE {table}')
+
+        size_text = f'{size / 1024 / 1024:,.1f} MiB' if size else 'n/a'
+        print(f'{name:<8} {args.rows / elapsed:>12,.0f} {size_text:>16}')
+
+
+if __name__ == '__main__':
+    main()
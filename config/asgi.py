@@ -11,6 +11,11 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
 
 application = get_asgi_application()
+
+# Imported once the application has set Django up.
+from app.core.templates import warm_up_templates  # noqa: E402
+
+warm_up_templates()
@@ -48,10 +48,11 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     # django
     'django.middleware.security.SecurityMiddleware',
+    'app.core.middleware.PrecompressedStaticMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'app.users.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     # thirdy-party
@@ -92,6 +93,14 @@ DATABASES = {
     }
 }
 
+# Aliases serving the safe-method APIView reads, a client that wrote is read
+# from the primary for READ_PRIMARY_SECONDS afterwards.
+DATABASE_ROUTERS = ['app.core.routers.PrimaryReplicaRouter']
+
+DATABASE_REPLICAS = []
+
+READ_PRIMARY_SECONDS = 5
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -136,9 +145,16 @@ MEDIA_URL = '/media/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Generate BaseModel primary keys as time-ordered UUIDv7 instead of UUIDv4.
+TIME_ORDERED_IDS = False
+
 
 AUTH_USER_MODEL = 'users.User'
 
+# User.email is unique through a unique index on lower(email), which the
+# USERNAME_FIELD check does not recognize.
+SILENCED_SYSTEM_CHECKS = ['auth.W004']
+
 # Allauth
 AUTHENTICATION_BACKENDS = [
     # Needed to login by username in Django admin, regardless of `allauth`
@@ -172,6 +188,50 @@ LOGGING = {
 # Django-Cotton
 COTTON_DIR = 'cotton_components'
 
+# Cache of the {% fragment %} and {% cached_component %} template tags.
+FRAGMENT_CACHE_ALIAS = 'default'
+
+FRAGMENT_CACHE_TIMEOUT = 300
+
+# Compile all the templates when a WSGI or ASGI worker starts instead of on
+# the first request to each, see app.core.templates.warm_up_templates.
+TEMPLATE_WARMUP = False
+
+# Response cache: shared cache alias behind the in-process LRU of each worker.
+RESPONSE_CACHE_ALIAS = 'default'
+
+RESPONSE_CACHE_LOCAL_MAX_ENTRIES = 1024
+
+# Query instrumentation of APIView.dispatch, a query shape executed at least
+# QUERY_REPEAT_THRESHOLD times in one request is reported as repeated.
+QUERY_INSTRUMENTATION = True
+
+QUERY_REPEAT_THRESHOLD = 3
+
+# Threads hashing and verifying passwords off the request and event loop
+# threads, see app.users.passwords.
+PASSWORD_HASHING_WORKERS = 4
+
+# Cache of the session user snapshots read by CachedAuthenticationMiddleware.
+USER_CACHE_ALIAS = 'default'
+
+USER_CACHE_TIMEOUT = 300
+
+# Cache holding the APIView.throttles counters, it must be shared by all the
+# processes (Redis, Memcached) for the limits to hold. THROTTLE_RATES
+# overrides the rate of a throttle by scope, e.g. {'login-ip': '60/m'}.
+THROTTLE_CACHE_ALIAS = 'default'
+
+THROTTLE_RATES = {}
+
+# Send the per-phase APIView timings in a Server-Timing header.
+SERVER_TIMING = DEBUG
+
+# JSON codec used by the API views: 'auto', 'orjson', 'msgspec', 'stdlib' or a
+# dotted path to a JSONCodec subclass. 'auto' picks the first installed of the
+# orjson and msgspec extras, and falls back to stdlib.
+JSON_CODEC = 'auto'
+
 
 LOGIN_REDIRECT_URL = 'homepage_template'
 
@@ -1 +1,10 @@
-from config.settings.base import * # noqa
\ No newline at end of file
+from config.settings.base import * # noqa
+from config.settings.base import DATABASES
+
+# A replica alias on the same SQLite file to exercise the read routing locally.
+DATABASES['replica'] = {
+    **DATABASES['default'],
+    'TEST': {'MIRROR': 'default'},
+}
+
+DATABASE_REPLICAS = ['replica']
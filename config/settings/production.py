@@ -0,0 +1,83 @@
+import os
+
+from config.settings.base import *  # noqa
+from config.settings.base import TEMPLATES
+
+DEBUG = False
+
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+ALLOWED_HOSTS = [
+    host for host in os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',') if host
+]
+
+# Addresses allowed to read the internal endpoints, such as the database pool
+# statistics.
+INTERNAL_IPS = os.environ.get('DJANGO_INTERNAL_IPS', '127.0.0.1').split(',')
+
+SERVER_TIMING = False
+
+# Compiled templates are kept for the life of the worker, and all of them are
+# compiled before it serves traffic.
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            **TEMPLATES[0]['OPTIONS'],
+            'loaders': [
+                (
+                    'django.template.loaders.cached.Loader',
+                    [
+                        'django_cotton.cotton_loader.Loader',
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ],
+                ),
+            ],
+        },
+    },
+]
+
+TEMPLATE_WARMUP = True
+
+# collectstatic writes content-hashed names and gzipped siblings, served with
+# immutable cache headers by PrecompressedStaticMiddleware.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'app.core.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'postgres'),
+        'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        # Persistent connections are checked before being reused, so a
+        # connection dropped by the server costs a reconnect, not an error.
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
+    }
+}
+
+# A psycopg pool per worker process instead of one persistent connection per
+# thread, needs the pool extra (psycopg[pool], psycopg 3). The pool checks
+# connections itself and Django requires CONN_MAX_AGE = 0 with it.
+DB_POOL_MAX_SIZE = int(os.environ.get('DJANGO_DB_POOL_MAX_SIZE', '0'))
+
+if DB_POOL_MAX_SIZE:
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('DJANGO_DB_POOL_MIN_SIZE', '1')),
+        'max_size': DB_POOL_MAX_SIZE,
+        'timeout': float(os.environ.get('DJANGO_DB_POOL_TIMEOUT', '10')),
+        'max_idle': float(os.environ.get('DJANGO_DB_POOL_MAX_IDLE', '600')),
+    }
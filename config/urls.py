@@ -4,4 +4,5 @@ from django.urls import include, path
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('auth/', include('app.users.urls')),
+    path('', include('app.core.urls')),
 ]
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
 
 application = get_wsgi_application()
+
+# Imported once the application has set Django up.
+from app.core.templates import warm_up_templates  # noqa: E402
+
+warm_up_templates()
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from benchmarks.base import Result, compare_results, load_results, save_results
+
+
+def make_result(name: str, median: float) -> Result:
+    return Result(name=name, loops=10, best=median, median=median)
+
+
+def test_results_round_trip_through_baseline(tmp_path: Path):
+    path = tmp_path / 'baseline.json'
+    results = [make_result('dispatch/echo', 0.001)]
+
+    save_results(path, results)
+    environment, loaded = load_results(path)
+
+    assert loaded == results
+    assert 'python' in environment
+
+
+def test_compare_results_matches_by_name():
+    baseline = [make_result('a', 1.0), make_result('b', 2.0)]
+    results = [make_result('a', 1.25), make_result('c', 1.0)]
+
+    [comparison] = compare_results(baseline, results)
+
+    assert comparison.name == 'a'
+    assert comparison.change == 0.25
@@ -1,3 +1,4 @@
+from django.core.cache import caches
 from django.test import Client
 
 from app.users.models import User
@@ -5,6 +6,20 @@ from app.users.models import User
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Throttle counters and cached users would leak between tests.
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def read_from_primary(settings):
+    # Tests that cover the replica routing opt back in and allow the replica
+    # alias in their django_db marker.
+    settings.DATABASE_REPLICAS = []
+
+
 @pytest.fixture
 def user_password() -> str:
     return '123qaz123'
@@ -0,0 +1,172 @@
+import time
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test.client import RequestFactory
+
+from app.core.cache import (
+    CachedResponse,
+    LocalLRUCache,
+    ResponseCache,
+    get_generation_key,
+    local_cache,
+)
+from app.core.views import APIView
+from app.users.models import User
+
+import pytest
+
+
+class CachedUsersAPIView(APIView):
+    http_method_names = ['get']
+    response_cache = ResponseCache(timeout=60, depends_on=[User])
+    calls = 0
+
+    def get(self, request, *args, **kwargs):
+        CachedUsersAPIView.calls += 1
+        return self.render_to_json(data={'count': User.objects.count()})
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    CachedUsersAPIView.calls = 0
+    local_cache.clear()
+    cache.clear()
+
+
+def make_entry(expires_in: float = 60) -> CachedResponse:
+    return CachedResponse(
+        status_code=200,
+        content=b'{}',
+        headers=(),
+        expires_at=time.time() + expires_in,
+    )
+
+
+def test_local_cache_evicts_least_recently_used():
+    lru = LocalLRUCache(max_entries=2)
+    lru.set('a', make_entry())
+    lru.set('b', make_entry())
+    lru.get('a')
+    lru.set('c', make_entry())
+
+    assert lru.get('a') is not None
+    assert lru.get('b') is None
+
+
+def test_local_cache_drops_expired_entries():
+    lru = LocalLRUCache(max_entries=2)
+    lru.set('a', make_entry(expires_in=-1))
+
+    assert lru.get('a') is None
+
+
+@pytest.mark.django_db
+def test_response_is_served_from_cache(rf: RequestFactory):
+    view = CachedUsersAPIView.as_view()
+
+    first = view(rf.get('/users?a=1&b=2'))
+    second = view(rf.get('/users?b=2&a=1'))
+
+    assert CachedUsersAPIView.calls == 1
+    assert second.content == first.content
+
+
+@pytest.mark.django_db
+def test_dependency_save_invalidates_cache(
+    rf: RequestFactory,
+    django_capture_on_commit_callbacks,
+):
+    view = CachedUsersAPIView.as_view()
+    view(rf.get('/users'))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        User.objects.create(email='test@test.com')
+    response = view(rf.get('/users'))
+
+    assert CachedUsersAPIView.calls == 2
+    assert response.content == b'{"count":1}'
+
+
+@pytest.mark.django_db
+def test_waits_for_worker_holding_the_lock(rf: RequestFactory):
+    response_cache = ResponseCache(depends_on=[User], lock_wait=0.2)
+    view_class = type(
+        'LockedAPIView',
+        (CachedUsersAPIView,),
+        {'response_cache': response_cache},
+    )
+    request = rf.get('/users')
+    view = view_class()
+    view.setup(request)
+    key = response_cache.get_key(
+        view,
+        'anonymous',
+        response_cache.get_generations(view),
+    )
+    cache.add(f'{key}:lock', True)
+
+    started = time.monotonic()
+    response = view_class.as_view()(request)
+
+    assert response.status_code == 200
+    assert time.monotonic() - started >= 0.2
+    assert cache.get(key) is None
+
+
+class CachedUserDetailAPIView(APIView):
+    http_method_names = ['get']
+    model = User
+    response_cache = ResponseCache(timeout=60)
+
+    def get(self, request, *args, **kwargs):
+        return self.render_to_json(data={'email': self.object.email})
+
+
+@pytest.mark.django_db
+def test_own_model_invalidates_cache_without_depends_on(
+    rf: RequestFactory,
+    django_capture_on_commit_callbacks,
+):
+    user = User.objects.create(email='old@test.com')
+    view = CachedUserDetailAPIView.as_view()
+    view(rf.get('/users/1'), pk=user.pk)
+
+    user.email = 'new@test.com'
+    with django_capture_on_commit_callbacks(execute=True):
+        user.save()
+    response = view(rf.get('/users/1'), pk=user.pk)
+
+    assert response.content == b'{"email":"new@test.com"}'
+
+
+@pytest.mark.django_db
+def test_writes_bump_generations_of_models_no_view_declared(
+    django_capture_on_commit_callbacks,
+):
+    key = get_generation_key(Group)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        group = Group.objects.create(name='test')
+    created = cache.get(key)
+    with django_capture_on_commit_callbacks(execute=True):
+        group.delete()
+
+    assert created is not None
+    assert cache.get(key) == created + 1
+
+
+@pytest.mark.django_db
+def test_uncommitted_writes_do_not_invalidate_cache(
+    rf: RequestFactory,
+    django_capture_on_commit_callbacks,
+):
+    view = CachedUsersAPIView.as_view()
+    view(rf.get('/users'))
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        User.objects.create(email='test@test.com')
+        view(rf.get('/users'))
+
+    assert CachedUsersAPIView.calls == 1
+    assert callbacks
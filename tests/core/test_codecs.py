@@ -0,0 +1,117 @@
+import datetime as dt
+import io
+import json
+import uuid
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from app.core import codecs
+
+import pytest
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+PAYLOAD = {
+    'id': uuid.UUID('8d6b4a04-0f4f-4d58-a9d9-2d0b1ab1c6a1'),
+    'name': 'Conceição',
+    'joined_at': dt.datetime(2025, 3, 11, 16, 27, 0, 123456, tzinfo=dt.UTC),
+    'tags': ['a', 'b'],
+}
+
+EXPECTED = {
+    'id': '8d6b4a04-0f4f-4d58-a9d9-2d0b1ab1c6a1',
+    'name': 'Conceição',
+    'tags': ['a', 'b'],
+}
+
+
+@pytest.fixture(params=['stdlib', 'orjson', 'msgspec'])
+def codec(request) -> codecs.JSONCodec:
+    try:
+        return codecs.load_codec(request.param)
+    except ImproperlyConfigured:
+        pytest.skip(f'{request.param} is not installed')
+
+
+def test_codec_roundtrip(codec: codecs.JSONCodec):
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded)['name'] == 'Conceição'
+
+
+def test_codec_encodes_django_types(codec: codecs.JSONCodec):
+    data = {**PAYLOAD, 'url': reverse_lazy('login')}
+
+    decoded = codecs.StdlibJSONCodec().loads(codec.dumps(data))
+
+    assert decoded == {
+        **EXPECTED,
+        'joined_at': '2025-03-11T16:27:00.123456Z',
+        'url': '/auth/session/',
+    }
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        dt.datetime(2025, 3, 11, 16, 27, 0, 123456, tzinfo=dt.UTC),
+        dt.datetime(2025, 3, 11, 16, 27, tzinfo=dt.timezone(dt.timedelta(hours=2))),
+        dt.datetime(2025, 3, 11, 16, 27, 0, 5),
+        dt.date(2025, 3, 11),
+        dt.time(16, 27, 0, 123456),
+        dt.timedelta(0),
+        dt.timedelta(days=1, seconds=3601, microseconds=500000),
+        dt.timedelta(microseconds=-120),
+    ],
+)
+def test_codec_output_does_not_depend_on_backend(codec: codecs.JSONCodec, value):
+    assert codec.dumps([value]) == codecs.StdlibJSONCodec().dumps([value])
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {'name': [ErrorDetail('This field is required.', code='required')]},
+        ReturnDict({'name': ErrorDetail('Invalid.')}, serializer=None),
+        ReturnList([{'count': 1}], serializer=None),
+    ],
+)
+def test_codec_encodes_drf_types(codec: codecs.JSONCodec, data):
+    assert codec.loads(codec.dumps(data)) == json.loads(json.dumps(data))
+
+
+def test_codec_raises_decode_error(codec: codecs.JSONCodec):
+    with pytest.raises(codecs.DecodeError):
+        codec.loads(b'invalid json')
+
+
+def test_stdlib_codec_output_is_compact_utf8():
+    assert codecs.StdlibJSONCodec().dumps({'a': 'ç'}) == '{"a":"ç"}'.encode()
+
+
+def test_get_codec_follows_setting():
+    with override_settings(JSON_CODEC='stdlib'):
+        assert isinstance(codecs.get_codec(), codecs.StdlibJSONCodec)
+
+
+def test_unknown_codec_is_improperly_configured():
+    with pytest.raises(ImproperlyConfigured):
+        codecs.load_codec('unknown')
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1024])
+def test_iter_array_yields_items_across_chunks(chunk_size: int):
+    body = ' [1, 2.5e3, "Conceição", {"tags": ["a", "b"]}, null, true] '.encode()
+
+    items = codecs.iter_array(io.BytesIO(body).read, chunk_size=chunk_size)
+
+    assert list(items) == [1, 2500.0, 'Conceição', {'tags': ['a', 'b']}, None, True]
+
+
+@pytest.mark.parametrize('body', [b'', b'{}', b'[1,', b'[1 2]', b'[1,]', b'[1] 2'])
+def test_iter_array_raises_decode_error(body: bytes):
+    with pytest.raises(codecs.DecodeError):
+        list(codecs.iter_array(io.BytesIO(body).read, chunk_size=2))
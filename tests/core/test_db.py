@@ -0,0 +1,19 @@
+from django.test import override_settings
+from django.urls import reverse
+
+import pytest
+
+
+@pytest.mark.django_db
+@override_settings(INTERNAL_IPS=['127.0.0.1'])
+def test_database_stats_for_internal_ips(client):
+    response = client.get(reverse('database_stats'))
+
+    assert response.status_code == 200
+    assert response.json()['default']['pooled'] is False
+
+
+@pytest.mark.django_db
+@override_settings(INTERNAL_IPS=[])
+def test_database_stats_hidden_from_other_ips(client):
+    assert client.get(reverse('database_stats')).status_code == 404
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+from django.contrib.auth.models import AnonymousUser
+from django.template import engines
+
+from app.core.fragments import get_fragment_key
+
+import pytest
+
+
+def render(source: str, **context) -> str:
+    return (
+        engines['django'].from_string('{% load fragments %}' + source).render(context)
+    )
+
+
+def test_fragment_is_rendered_once():
+    source = "{% fragment 'counter' %}{{ value }}{% endfragment %}"
+
+    assert render(source, value=1) == '1'
+    assert render(source, value=2) == '1'
+
+
+def test_fragment_key_varies_with_attributes_and_version():
+    source = (
+        "{% fragment 'counter' page=page version=version %}{{ value }}{% endfragment %}"
+    )
+
+    assert render(source, page=1, version=1, value='a') == 'a'
+    assert render(source, page=2, version=1, value='b') == 'b'
+    assert render(source, page=1, version=2, value='c') == 'c'
+    assert render(source, page=1, version=1, value='d') == 'a'
+
+
+def test_user_scoped_fragment_is_cached_per_user():
+    source = "{% fragment 'menu' scope='user' %}{{ value }}{% endfragment %}"
+    alice = SimpleNamespace(user=SimpleNamespace(pk=1, is_authenticated=True))
+    bob = SimpleNamespace(user=SimpleNamespace(pk=2, is_authenticated=True))
+
+    assert render(source, request=alice, value='a') == 'a'
+    assert render(source, request=alice, value='b') == 'a'
+    assert render(source, request=bob, value='c') == 'c'
+
+
+@pytest.mark.parametrize(
+    'request_',
+    [SimpleNamespace(user=AnonymousUser()), None],
+    ids=['anonymous', 'no-request'],
+)
+def test_user_scoped_fragment_is_not_cached_for_anonymous_visitors(request_):
+    source = "{% fragment 'menu' scope='user' %}{{ value }}{% endfragment %}"
+
+    assert render(source, request=request_, value='a') == 'a'
+    assert render(source, request=request_, value='b') == 'b'
+
+
+def test_user_scoped_fragment_key():
+    alice = SimpleNamespace(pk=1, is_authenticated=True)
+    bob = SimpleNamespace(pk=2, is_authenticated=True)
+
+    keys = {
+        get_fragment_key('menu', {}, scope='user', user=user) for user in (alice, bob)
+    }
+
+    assert len(keys) == 2
+    assert get_fragment_key('menu', {}) not in keys
+    with pytest.raises(ValueError):
+        get_fragment_key('menu', {}, scope='session')
+
+
+@pytest.mark.parametrize('user', [AnonymousUser(), None])
+def test_user_scoped_fragment_key_requires_authenticated_user(user):
+    with pytest.raises(ValueError):
+        get_fragment_key('menu', {}, scope='user', user=user)
+
+
+def test_cached_component_renders_cotton_component():
+    source = "{% cached_component 'input.primary' name=name type='email' %}"
+
+    first = render(source, name='email')
+    assert 'name="email"' in first
+    assert 'type="email"' in first
+    assert 'name="other"' in render(source, name='other')
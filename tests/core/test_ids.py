@@ -0,0 +1,30 @@
+import time
+import uuid
+
+from django.test import override_settings
+
+from app.core.ids import generate_id, uuid7
+
+
+def test_uuid7_layout():
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert abs((value.int >> 80) - time.time_ns() // 1_000_000) < 1000
+
+
+def test_uuid7_is_monotonic():
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_generate_id_defaults_to_uuid4():
+    assert generate_id().version == 4
+
+
+@override_settings(TIME_ORDERED_IDS=True)
+def test_generate_id_time_ordered():
+    assert generate_id().version == 7
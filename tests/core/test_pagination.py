@@ -0,0 +1,90 @@
+from app.core.exceptions import ValidationError
+from app.core.filters import BaseFilterSet
+from app.core.pagination import Cursor
+from app.core.views import APIView
+from app.users.models import User
+
+import pytest
+
+
+class UserFilter(BaseFilterSet):
+    cursor_ordering = ('joined_at', 'id')
+    page_size = 2
+
+    class Meta:
+        model = User
+        fields = ['first_name']
+
+
+@pytest.fixture
+def users() -> list[User]:
+    return [
+        User.objects.create(email=f'user{index}@test.com', first_name='Test')
+        for index in range(5)
+    ]
+
+
+def paginate(data: dict) -> dict:
+    view = APIView()
+    view.data = data
+    page = view.get_paginated_queryset(UserFilter, User.objects.all())
+    return {
+        'emails': [user.email for user in page.object_list],
+        'next': page.next_cursor,
+        'previous': page.previous_cursor,
+    }
+
+
+@pytest.mark.django_db
+def test_paginate_forward_and_backward(users: list[User]):
+    first = paginate({})
+    second = paginate({'cursor': first['next']})
+    third = paginate({'cursor': second['next']})
+
+    assert first['emails'] == ['user0@test.com', 'user1@test.com']
+    assert first['previous'] is None
+    assert second['emails'] == ['user2@test.com', 'user3@test.com']
+    assert third['emails'] == ['user4@test.com']
+    assert third['next'] is None
+
+    back = paginate({'cursor': third['previous']})
+    assert back['emails'] == second['emails']
+    assert paginate({'cursor': back['previous']})['emails'] == first['emails']
+
+
+@pytest.mark.django_db
+def test_paginate_applies_filters_and_page_size(users: list[User]):
+    User.objects.filter(email='user1@test.com').update(first_name='Other')
+
+    page = paginate({'first_name': 'Test', 'page_size': '3'})
+
+    assert page['emails'] == ['user0@test.com', 'user2@test.com', 'user3@test.com']
+
+
+@pytest.mark.django_db
+def test_paginate_invalid_cursor():
+    with pytest.raises(ValidationError):
+        paginate({'cursor': 'not-a-cursor'})
+
+
+@pytest.mark.parametrize(
+    'position',
+    [
+        ['not-a-date', 1],
+        ['2026-01-01T00:00:00+00:00', 'not-an-id'],
+        ['2026-01-01T00:00:00+00:00', 1, 2],
+        [[], 1],
+    ],
+)
+@pytest.mark.django_db
+def test_paginate_invalid_cursor_position(position: list):
+    cursor = Cursor(tuple(position)).encode()
+
+    with pytest.raises(ValidationError):
+        paginate({'cursor': cursor})
+
+
+@pytest.mark.django_db
+def test_paginate_invalid_page_size():
+    with pytest.raises(ValidationError):
+        paginate({'page_size': 'abc'})
@@ -0,0 +1,58 @@
+from django.test import override_settings
+from django.test.client import RequestFactory
+
+from app.core.queries import normalize_sql
+from app.core.testing import assert_query_budget
+from app.core.views import APIView
+from app.users.models import User
+
+import pytest
+
+
+class NPlusOneAPIView(APIView):
+    http_method_names = ['get']
+    query_budget = 2
+
+    def get(self, request, *args, **kwargs):
+        emails = [
+            User.objects.get(pk=user.pk).email for user in User.objects.order_by('pk')
+        ]
+        return self.render_to_json(data={'emails': emails})
+
+
+@pytest.fixture
+def users() -> list[User]:
+    return [User.objects.create(email=f'user{index}@test.com') for index in range(3)]
+
+
+def test_normalize_sql_folds_in_lists():
+    assert normalize_sql('SELECT 1 WHERE id IN (%s, %s)') == normalize_sql(
+        'SELECT 1 WHERE id IN (%s)'
+    )
+
+
+@pytest.mark.django_db
+def test_report_counts_repeated_queries(rf: RequestFactory, users: list[User]):
+    response = NPlusOneAPIView.as_view()(rf.get('/dummy'))
+
+    report = response.query_report
+    assert report.count == 4
+    assert list(report.repeated.values()) == [3]
+    assert report.exceeds_budget
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_report_header_in_debug(rf: RequestFactory, users: list[User]):
+    response = NPlusOneAPIView.as_view()(rf.get('/dummy'))
+
+    assert response['X-DB-Queries'].startswith('count=4;')
+
+
+@pytest.mark.django_db
+def test_assert_query_budget(rf: RequestFactory, users: list[User]):
+    response = NPlusOneAPIView.as_view()(rf.get('/dummy'))
+
+    assert_query_budget(response, budget=4)
+    with pytest.raises(pytest.fail.Exception):
+        assert_query_budget(response)
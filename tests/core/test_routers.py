@@ -0,0 +1,56 @@
+from django.db import connections
+from django.http import HttpResponse
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from app.core.views import READ_PRIMARY_COOKIE, APIView
+from app.users.models import User
+
+import pytest
+
+
+class UserCountAPIView(APIView):
+    http_method_names = ['get', 'post']
+
+    def get(self, request, *args, **kwargs):
+        return self.render_to_json(data={'count': User.objects.count()})
+
+    def post(self, request, *args, **kwargs):
+        User.objects.create(email='test@test.com')
+        return self.render_to_json(status_code=201)
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.DATABASE_REPLICAS = ['replica']
+
+
+def count_queries(request) -> tuple[HttpResponse, dict[str, int]]:
+    with (
+        CaptureQueriesContext(connections['default']) as primary,
+        CaptureQueriesContext(connections['replica']) as replica,
+    ):
+        response = UserCountAPIView.as_view()(request)
+    return response, {'default': len(primary), 'replica': len(replica)}
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_safe_reads_go_to_a_replica(rf: RequestFactory, replicas):
+    _response, queries = count_queries(rf.get('/dummy'))
+
+    assert queries == {'default': 0, 'replica': 1}
+
+
+# The replica is another connection to the same SQLite test database, the
+# write has to be committed for it not to hit a table lock.
+@pytest.mark.django_db(databases=['default', 'replica'], transaction=True)
+def test_writes_pin_the_client_to_the_primary(rf: RequestFactory, replicas):
+    response, queries = count_queries(rf.post('/dummy'))
+
+    assert queries['replica'] == 0
+    assert response.cookies[READ_PRIMARY_COOKIE]['max-age'] == 5
+
+    request = rf.get('/dummy')
+    request.COOKIES[READ_PRIMARY_COOKIE] = '1'
+    _response, queries = count_queries(request)
+    assert queries == {'default': 1, 'replica': 0}
@@ -0,0 +1,162 @@
+import datetime as dt
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from app.core.serializers import BaseSerializer
+from app.users.models import User
+
+import pytest
+from rest_framework import serializers
+
+
+class UserSerializer(BaseSerializer):
+    id = serializers.IntegerField()
+    email = serializers.EmailField()
+    first_name = serializers.CharField()
+    birth_date = serializers.DateField()
+    joined_at = serializers.DateTimeField()
+    is_active = serializers.BooleanField()
+    password = serializers.CharField(write_only=True)
+
+
+class CompiledUserSerializer(UserSerializer):
+    compile_mode = 'objects'
+
+    display_name = serializers.SerializerMethodField()
+    username = serializers.CharField(source='get_username')
+
+    def get_display_name(self, user: User) -> str:
+        return f'{user.first_name} <{user.email}>'
+
+
+class DRFUserSerializer(CompiledUserSerializer):
+    compile_mode = None
+
+
+class ValuesUserSerializer(UserSerializer):
+    compile_mode = 'values'
+
+
+class ContextUserSerializer(BaseSerializer):
+    compile_mode = 'objects'
+
+    email = serializers.EmailField()
+    viewer = serializers.SerializerMethodField()
+
+    def get_viewer(self, user: User) -> str:
+        return self.context['viewer']
+
+
+class ProfileSerializer(BaseSerializer):
+    bio = serializers.CharField()
+
+
+class ProfileRowSerializer(BaseSerializer):
+    compile_mode = 'objects'
+
+    nickname = serializers.CharField()
+    profile = ProfileSerializer()
+
+
+class MissingProfileRow:
+    # Mimics a reverse one-to-one relation without a related row.
+    @property
+    def nickname(self) -> str:
+        raise ObjectDoesNotExist
+
+    @property
+    def profile(self) -> None:
+        raise ObjectDoesNotExist
+
+
+@pytest.fixture
+def users() -> list[User]:
+    return [
+        User.objects.create(
+            email='test@test.com',
+            first_name='Test',
+            birth_date=dt.date(1990, 1, 1),
+        ),
+        User.objects.create(email='other@test.com', is_active=False),
+    ]
+
+
+@pytest.mark.django_db
+def test_compiled_objects_match_drf(users: list[User]):
+    expected = DRFUserSerializer(users, many=True).data
+
+    assert CompiledUserSerializer.represent_many(users) == expected
+
+
+@pytest.mark.django_db
+def test_compiled_values_match_drf(users: list[User]):
+    queryset = User.objects.order_by('id')
+    expected = UserSerializer(queryset, many=True).data
+
+    assert ValuesUserSerializer.values_fields == [
+        'id',
+        'email',
+        'first_name',
+        'birth_date',
+        'joined_at',
+        'is_active',
+    ]
+    assert ValuesUserSerializer.represent_many(queryset) == expected
+
+
+@pytest.mark.django_db
+def test_compiled_fields_see_the_context(users: list[User]):
+    first = ContextUserSerializer.represent_many(users, context={'viewer': 'first'})
+    second = ContextUserSerializer.represent_many(users, context={'viewer': 'second'})
+
+    assert [row['viewer'] for row in first] == ['first', 'first']
+    assert [row['viewer'] for row in second] == ['second', 'second']
+
+
+def test_compiled_missing_relations_match_drf():
+    rows = [MissingProfileRow()]
+    expected = ProfileRowSerializer(rows, many=True).data
+
+    assert expected == [{'nickname': None, 'profile': None}]
+    assert ProfileRowSerializer.represent_many(rows) == expected
+
+
+class MissingAttributesSerializer(BaseSerializer):
+    compile_mode = 'objects'
+
+    email = serializers.EmailField()
+    with_default = serializers.CharField(default='default')
+    nullable = serializers.CharField(allow_null=True)
+    optional = serializers.CharField(required=False)
+    read_only = serializers.CharField(read_only=True)
+
+
+@pytest.mark.django_db
+def test_compiled_missing_attributes_match_drf(users: list[User]):
+    expected = MissingAttributesSerializer(users, many=True).data
+
+    assert expected[0] == {
+        'email': 'test@test.com',
+        'with_default': 'default',
+        'nullable': None,
+    }
+    assert MissingAttributesSerializer.represent_many(users) == expected
+
+
+def test_compiled_missing_required_attribute_raises():
+    class RequiredSerializer(BaseSerializer):
+        compile_mode = 'objects'
+
+        missing = serializers.CharField()
+
+    with pytest.raises(AttributeError):
+        RequiredSerializer.represent_many([object()])
+
+
+def test_values_mode_requires_plain_attributes():
+    with pytest.raises(TypeError):
+
+        class InvalidSerializer(BaseSerializer):
+            compile_mode = 'values'
+
+            display_name = serializers.SerializerMethodField()
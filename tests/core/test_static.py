@@ -0,0 +1,83 @@
+import gzip
+from pathlib import Path
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import Client
+
+import pytest
+
+CSS = 'body { color: black; }\n' * 50
+
+
+@pytest.fixture
+def collected(settings, tmp_path: Path) -> Path:
+    source = tmp_path / 'static'
+    (source / 'css').mkdir(parents=True)
+    (source / 'css' / 'site.css').write_text(CSS)
+    (source / 'css' / 'tiny.css').write_text('a {}')
+    (source / 'logo.png').write_bytes(b'\x89PNG' * 100)
+
+    settings.STATICFILES_DIRS = [source]
+    settings.STATIC_ROOT = tmp_path / 'static_root'
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {
+            'BACKEND': 'app.core.storage.CompressedManifestStaticFilesStorage',
+        },
+    }
+    call_command('collectstatic', interactive=False, verbosity=0)
+    return settings.STATIC_ROOT
+
+
+def test_collectstatic_writes_hashed_and_gzipped_files(collected: Path):
+    hashed_name = staticfiles_storage.stored_name('css/site.css')
+
+    assert hashed_name != 'css/site.css'
+    assert (collected / 'staticfiles.json').exists()
+    assert (
+        gzip.decompress((collected / f'{hashed_name}.gz').read_bytes()) == CSS.encode()
+    )
+    assert (collected / 'css/site.css.gz').exists()
+    assert not (collected / 'css/tiny.css.gz').exists()
+    assert not (collected / 'logo.png.gz').exists()
+
+
+def test_hashed_file_is_served_precompressed_and_immutable(collected: Path):
+    url = staticfiles_storage.url('css/site.css')
+
+    response = Client().get(url, headers={'accept-encoding': 'gzip, br'})
+
+    assert response.status_code == 200
+    assert response['Content-Encoding'] == 'gzip'
+    assert response['Content-Type'].startswith('text/css')
+    assert 'immutable' in response['Cache-Control']
+    assert response['Vary'] == 'Accept-Encoding'
+    assert 'Content-Disposition' not in response
+    assert gzip.decompress(b''.join(response.streaming_content)) == CSS.encode()
+
+
+def test_unhashed_file_is_served_without_compression(collected: Path):
+    response = Client().get('/static/css/site.css')
+
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response
+    assert 'immutable' not in response['Cache-Control']
+    assert b''.join(response.streaming_content) == CSS.encode()
+
+
+def test_not_modified_keeps_cache_headers(collected: Path):
+    url = staticfiles_storage.url('css/site.css')
+    client = Client()
+    last_modified = client.get(url)['Last-Modified']
+
+    response = client.get(url, headers={'if-modified-since': last_modified})
+
+    assert response.status_code == 304
+    assert response['Vary'] == 'Accept-Encoding'
+    assert 'immutable' in response['Cache-Control']
+    assert response['Last-Modified'] == last_modified
+
+
+def test_missing_static_file_falls_through(collected: Path):
+    assert Client().get('/static/missing.css').status_code == 404
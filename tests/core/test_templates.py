@@ -0,0 +1,61 @@
+import logging
+from io import StringIO
+
+from django.core.management import call_command
+from django.template import engines
+
+from app.core.templates import precompile_templates, warm_up_templates
+
+
+def get_template_cache() -> dict:
+    (loader,) = engines['django'].engine.template_loaders
+    return loader.get_template_cache
+
+
+def test_precompile_templates_loads_cotton_components():
+    get_template_cache().clear()
+
+    results = precompile_templates()
+
+    names = [result.name for result in results]
+    assert 'cotton_components/input/primary.html' in names
+    assert all(result.error is None and result.seconds > 0 for result in results)
+    assert 'cotton_components/input/primary.html' in get_template_cache()
+
+
+def test_warm_up_templates_follows_setting(settings, caplog):
+    get_template_cache().clear()
+    settings.TEMPLATE_WARMUP = False
+    warm_up_templates()
+    assert not get_template_cache()
+
+    settings.TEMPLATE_WARMUP = True
+    with caplog.at_level(logging.INFO, logger='app.core.templates'):
+        warm_up_templates()
+    assert 'users/login.html' in get_template_cache()
+    assert caplog.messages[0].startswith('Compiled ')
+
+
+def test_warm_up_templates_reports_each_template_slowest_first(settings, caplog):
+    get_template_cache().clear()
+    settings.TEMPLATE_WARMUP = True
+
+    with caplog.at_level(logging.INFO, logger='app.core.templates'):
+        warm_up_templates()
+
+    timings = {
+        record.args[0]: record.args[1]
+        for record in caplog.records
+        if record.msg == 'Compiled %s in %.2fms.'
+    }
+    assert 'users/login.html' in timings
+    assert list(timings.values()) == sorted(timings.values(), reverse=True)
+
+
+def test_warm_templates_reports_compile_times():
+    stdout = StringIO()
+    call_command('warm_templates', no_apps=True, stdout=stdout)
+
+    lines = stdout.getvalue().splitlines()
+    assert lines[-1].startswith('Compiled ')
+    assert any(line.endswith('ms  users/login.html') for line in lines)
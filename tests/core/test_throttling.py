@@ -0,0 +1,58 @@
+from django.test import Client, override_settings
+from django.test.client import RequestFactory
+from django.urls import reverse
+
+from app.core.throttling import Throttle, data_field
+from app.core.views import APIView
+
+import pytest
+
+
+class ThrottledAPIView(APIView):
+    http_method_names = ['post']
+    throttles = (Throttle('test-email', rate='2/m', key=data_field('email')),)
+
+    def post(self, request, *args, **kwargs):
+        return self.render_to_json(data={'ok': True})
+
+
+def test_sliding_window_weights_the_previous_window():
+    throttle = Throttle('test', rate='10/m')
+    for _ in range(10):
+        assert throttle.hit('ident', now=59.0) is None
+
+    # A quarter into the next window, 7.5 of the previous hits still count.
+    assert throttle.hit('ident', now=75.0) is None
+    assert throttle.hit('ident', now=75.0) is None
+    assert throttle.hit('ident', now=75.0) == pytest.approx(3.0)
+
+
+@pytest.mark.django_db
+def test_throttled_view_responds_429(rf: RequestFactory):
+    view = ThrottledAPIView.as_view()
+
+    def post(email: str):
+        return view(
+            rf.post('/dummy', data={'email': email}, content_type='application/json')
+        )
+
+    assert post('a@test.com').status_code == 200
+    assert post('A@test.com').status_code == 200
+    response = post('a@test.com')
+    assert response.status_code == 429
+    assert int(response['Retry-After']) > 0
+    assert post('b@test.com').status_code == 200
+
+
+@pytest.mark.django_db
+@override_settings(THROTTLE_RATES={'login-email': '1/m'})
+def test_login_is_throttled_per_email():
+    def login():
+        return Client().post(
+            reverse('login'),
+            data={'login': 'test@test.com', 'password': 'wrong'},
+            content_type='application/json',
+        )
+
+    assert login().status_code == 400
+    assert login().status_code == 429
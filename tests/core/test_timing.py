@@ -0,0 +1,66 @@
+from django.test import override_settings
+from django.test.client import RequestFactory
+
+from app.core.timing import Histogram, PhaseTimer, histograms
+from app.core.views import APIView
+
+import pytest
+
+
+class TimedAPIView(APIView):
+    http_method_names = ['get']
+
+    def get(self, request, *args, **kwargs):
+        return self.render_to_json(data={'ok': True})
+
+
+@pytest.fixture(autouse=True)
+def clear_histograms():
+    histograms.clear()
+
+
+def test_phase_timer_accumulates_repeated_phases():
+    timer = PhaseTimer()
+    timer.record('serialize', 1_000)
+    timer.record('serialize', 2_500)
+
+    assert timer.phases == {'serialize': 3_500}
+    assert timer.to_header() == 'serialize;dur=0.004'
+
+
+def test_histogram_buckets_by_power_of_two():
+    histogram = Histogram()
+    histogram.record(1_000)
+    histogram.record(1_023)
+    histogram.record(1 << 60)
+
+    assert histogram.count == 3
+    assert histogram.buckets[10] == 2
+    assert histogram.buckets[-1] == 1
+
+
+@pytest.mark.django_db
+@override_settings(SERVER_TIMING=True)
+def test_server_timing_header(rf: RequestFactory):
+    response = TimedAPIView.as_view()(rf.get('/dummy'))
+
+    phases = [entry.split(';')[0] for entry in response['Server-Timing'].split(', ')]
+    assert set(phases) == {
+        'total',
+        'data',
+        'conditional',
+        'object',
+        'handler',
+        'render',
+    }
+
+
+@pytest.mark.django_db
+@override_settings(SERVER_TIMING=False)
+def test_timings_feed_histograms_without_header(rf: RequestFactory):
+    TimedAPIView.as_view()(rf.get('/dummy'))
+    response = TimedAPIView.as_view()(rf.get('/dummy'))
+
+    assert 'Server-Timing' not in response
+    snapshot = histograms.snapshot()[f'{__name__}.TimedAPIView']
+    assert snapshot['total']['count'] == 2
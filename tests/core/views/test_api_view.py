@@ -1,11 +1,14 @@
 import json
 from urllib.parse import urlencode
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.test import override_settings
 from django.test.client import RequestFactory
 
 from app.core.exceptions import APIError, ValidationError
 from app.core.serializers import BaseSerializer
 from app.core.views import APIView
+from app.users.models import User
 
 import pytest
 from rest_framework import serializers
@@ -65,6 +68,70 @@ def test_parse_json_body_invalid(rf: RequestFactory):
     assert exc_info.value.status_code == 400
 
 
+def test_parse_json_body_rejects_declared_length_over_limit(rf: RequestFactory):
+    request = rf.post(
+        '/dummy', data=json.dumps({'key': 'x' * 100}), content_type='application/json'
+    )
+
+    view = APIView()
+    view.max_body_size = 64
+    view.request = request
+    with pytest.raises(APIError) as exc_info:
+        view.parse_json_body()
+    assert exc_info.value.status_code == 413
+
+
+def test_parse_json_body_accepts_view_limit_above_global(rf: RequestFactory, settings):
+    settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 64
+    data = {'key': 'x' * 1000}
+    request = rf.post('/dummy', data=json.dumps(data), content_type='application/json')
+
+    view = APIView()
+    view.max_body_size = 10 * 1024
+    view.body_chunk_size = 256
+    view.request = request
+    assert view.parse_json_body() == data
+
+
+def test_iter_json_items_streams_array(rf: RequestFactory):
+    items = [{'name': f'item {index}'} for index in range(50)]
+    request = rf.post('/dummy', data=json.dumps(items), content_type='application/json')
+
+    view = APIView()
+    view.stream_json_body = True
+    view.body_chunk_size = 16
+    view.request = request
+    assert view.get_request_data() == {}
+    assert list(view.iter_json_items()) == items
+
+
+def test_iter_json_items_enforces_limit_on_bytes_read(rf: RequestFactory):
+    request = rf.post(
+        '/dummy', data=json.dumps(list(range(100))), content_type='application/json'
+    )
+    # A chunked upload doesn't declare its length.
+    del request.META['CONTENT_LENGTH']
+
+    view = APIView()
+    view.max_body_size = 64
+    view.body_chunk_size = 16
+    view.request = request
+    items = view.iter_json_items()
+    with pytest.raises(APIError) as exc_info:
+        list(items)
+    assert exc_info.value.status_code == 413
+
+
+def test_iter_json_items_invalid(rf: RequestFactory):
+    request = rf.post('/dummy', data='[1, oops]', content_type='application/json')
+
+    view = APIView()
+    view.request = request
+    with pytest.raises(APIError) as exc_info:
+        list(view.iter_json_items())
+    assert exc_info.value.status_code == 400
+
+
 def test_get_request_data_get(rf: RequestFactory):
     request = rf.get('/dummy?foo=bar')
 
@@ -117,6 +184,25 @@ def test_dispatch_get(rf: RequestFactory):
     assert result['message'] == 'success'
 
 
+@pytest.mark.parametrize(
+    ('error', 'expected'),
+    [
+        (
+            DjangoValidationError('Error while saving.'),
+            {'__all__': ['Error while saving.']},
+        ),
+        (DjangoValidationError({'email': ['Taken.']}), {'email': ['Taken.']}),
+    ],
+)
+def test_handle_exception_renders_django_validation_errors(error, expected):
+    view = APIView()
+
+    response = view.handle_exception(error)
+
+    assert response.status_code == 400
+    assert json.loads(response.content)['errors'] == expected
+
+
 def test_get_validated_input_success():
     view = APIView()
     view.data = {'name': 'John Doe'}
@@ -137,3 +223,72 @@ def test_get_validated_input_invalid():
     assert 'name' in error_detail
 
 
+@pytest.mark.parametrize('codec', ['stdlib', 'orjson', 'msgspec'])
+def test_invalid_input_is_rendered_by_every_codec(codec: str):
+    view = APIView()
+    view.data = {}
+
+    with override_settings(JSON_CODEC=codec):
+        try:
+            view.get_validated_input(DummySerializer)
+        except ValidationError as error:
+            response = view.handle_exception(error)
+
+    assert response.status_code == 400
+    assert 'name' in json.loads(response.content)['errors']
+
+
+class DummyUserSerializer(BaseSerializer):
+    email = serializers.EmailField()
+    first_name = serializers.CharField()
+
+
+@pytest.mark.django_db
+def test_render_to_json_stream_serializes_in_chunks():
+    for index in range(5):
+        User.objects.create(email=f'user{index}@test.com', first_name=f'User {index}')
+
+    view = APIView()
+    view.stream_chunk_size = 2
+    response = view.render_to_json_stream(
+        serializer_class=DummyUserSerializer,
+        queryset=User.objects.order_by('email'),
+    )
+
+    chunks = list(response.streaming_content)
+    result = json.loads(b''.join(chunks))
+    assert response['Content-Type'] == 'application/json'
+    assert len(chunks) == 5
+    assert [row['email'] for row in result] == [
+        f'user{index}@test.com' for index in range(5)
+    ]
+
+
+class PlainUserSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    requested_path = serializers.SerializerMethodField()
+
+    def get_requested_path(self, user: User) -> str:
+        return self.context['request'].path
+
+
+@pytest.mark.django_db
+def test_get_serialized_queryset_accepts_drf_serializers(rf: RequestFactory):
+    User.objects.create(email='test@test.com')
+    view = APIView()
+    view.setup(rf.get('/users/'))
+
+    data = view.get_serialized_queryset(PlainUserSerializer, User.objects.all())
+
+    assert data == [{'email': 'test@test.com', 'requested_path': '/users/'}]
+
+
+@pytest.mark.django_db
+def test_render_to_json_stream_empty_queryset():
+    view = APIView()
+    response = view.render_to_json_stream(
+        serializer_class=DummyUserSerializer,
+        queryset=User.objects.none(),
+    )
+
+    assert json.loads(b''.join(response.streaming_content)) == []
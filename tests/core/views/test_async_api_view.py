@@ -0,0 +1,118 @@
+import json
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured
+from django.test.client import AsyncRequestFactory
+
+from app.core.views import AsyncAPIView, AsyncAuthenticatedAPIView
+from app.users.models import User
+
+import pytest
+from asgiref.sync import async_to_sync
+
+
+class DummyAsyncAPIView(AsyncAPIView):
+    http_method_names = ['get', 'post']
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_json(data={'message': 'success'})
+
+    async def post(self, request, *args, **kwargs):
+        return self.render_to_json(data=self.data)
+
+
+class DummyUserAsyncAPIView(AsyncAPIView):
+    http_method_names = ['get']
+    model = User
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_json(data={'email': self.object.email})
+
+
+class DummyAsyncAuthenticatedAPIView(AsyncAuthenticatedAPIView):
+    http_method_names = ['get']
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_json(data={'message': 'success'})
+
+
+@pytest.fixture
+def async_rf() -> AsyncRequestFactory:
+    return AsyncRequestFactory()
+
+
+def test_async_view_is_async():
+    assert DummyAsyncAPIView.view_is_async
+
+
+def test_async_dispatch_get(async_rf: AsyncRequestFactory):
+    request = async_rf.get('/dummy')
+
+    response = async_to_sync(DummyAsyncAPIView.as_view())(request)
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {'message': 'success'}
+
+
+def test_async_dispatch_parses_json_body(async_rf: AsyncRequestFactory):
+    request = async_rf.post(
+        '/dummy',
+        data={'foo': 'bar'},
+        content_type='application/json',
+    )
+
+    response = async_to_sync(DummyAsyncAPIView.as_view())(request)
+
+    assert json.loads(response.content) == {'foo': 'bar'}
+
+
+def test_async_dispatch_invalid_json(async_rf: AsyncRequestFactory):
+    request = async_rf.post(
+        '/dummy',
+        data='invalid json',
+        content_type='application/json',
+    )
+
+    response = async_to_sync(DummyAsyncAPIView.as_view())(request)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_async_get_object(async_rf: AsyncRequestFactory):
+    user = User.objects.create(email='test@test.com')
+    request = async_rf.get('/dummy')
+
+    response = async_to_sync(DummyUserAsyncAPIView.as_view())(request, pk=user.pk)
+
+    assert json.loads(response.content) == {'email': 'test@test.com'}
+
+
+@pytest.mark.django_db
+def test_async_get_object_not_found(async_rf: AsyncRequestFactory):
+    request = async_rf.get('/dummy')
+
+    response = async_to_sync(DummyUserAsyncAPIView.as_view())(request, pk=1)
+
+    assert response.status_code == 404
+
+
+def test_async_authenticated_view_rejects_anonymous(
+    async_rf: AsyncRequestFactory,
+):
+    async def auser():
+        return AnonymousUser()
+
+    request = async_rf.get('/dummy')
+    request.auser = auser
+
+    response = async_to_sync(DummyAsyncAuthenticatedAPIView.as_view())(request)
+
+    assert response.status_code == 302
+
+
+def test_query_budget_is_rejected_on_async_views():
+    with pytest.raises(ImproperlyConfigured):
+
+        class BudgetedAsyncAPIView(AsyncAPIView):
+            query_budget = 3
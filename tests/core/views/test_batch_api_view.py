@@ -0,0 +1,103 @@
+import json
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit
+
+from django.contrib import auth
+from django.contrib.auth.models import AnonymousUser
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from app.core.views import BatchAPIView
+from app.users.models import User
+
+import pytest
+
+SIGNUP = {
+    'first_name': 'Test',
+    'email': 'test@test.com',
+    'password1': '123qaz123',
+    'password2': '123qaz123',
+}
+
+
+def post_batch(client: Client, requests: list[dict], **kwargs):
+    response = client.post(
+        reverse('batch'),
+        data={'requests': requests, **kwargs},
+        content_type='application/json',
+    )
+    return response, json.loads(response.content)
+
+
+@pytest.mark.django_db
+def test_batch_dispatches_each_request(client: Client):
+    response, data = post_batch(
+        client,
+        [
+            {'method': 'POST', 'path': reverse('create_list_users'), 'body': SIGNUP},
+            {'method': 'POST', 'path': reverse('create_list_users'), 'body': SIGNUP},
+            {'method': 'GET', 'path': '/missing/'},
+            {'method': 'GET', 'path': reverse('login_template')},
+        ],
+    )
+
+    assert response.status_code == 200
+    assert data['committed'] is True
+    assert [result['status'] for result in data['results']] == [201, 400, 404, 400]
+    assert 'redirect_url' in data['results'][0]['body']
+    assert User.objects.filter(email='test@test.com').exists()
+
+
+@pytest.mark.django_db
+def test_atomic_batch_rolls_back_on_failure(client: Client):
+    signups = [SIGNUP, SIGNUP, {**SIGNUP, 'email': 'other@test.com'}]
+    _, data = post_batch(
+        client,
+        [
+            {'method': 'POST', 'path': reverse('create_list_users'), 'body': body}
+            for body in signups
+        ],
+        atomic=True,
+    )
+
+    assert data['committed'] is False
+    assert [result['status'] for result in data['results']] == [201, 400, 424]
+    assert not User.objects.exists()
+
+
+@pytest.mark.django_db
+def test_batch_shares_the_session(client: Client, settings):
+    settings.LOGIN_REDIRECT_URL = 'profile_template'
+    User.objects.create_user(email='test@test.com', password='123qaz123')
+    credentials = {'login': 'test@test.com', 'password': '123qaz123'}
+
+    _, data = post_batch(
+        client,
+        [{'method': 'POST', 'path': reverse('login'), 'body': credentials}],
+    )
+
+    assert data['results'][0]['status'] == 200
+    assert auth.get_user(client).email == 'test@test.com'
+
+
+@pytest.mark.django_db
+def test_batch_size_is_limited(client: Client):
+    request = {'method': 'GET', 'path': '/missing/'}
+
+    response, _ = post_batch(client, [request] * 21)
+
+    assert response.status_code == 400
+
+
+def test_subrequests_are_json_only_with_a_body(rf: RequestFactory):
+    view = BatchAPIView()
+    view.setup(rf.post('/batch/', data={}, content_type='application/json'))
+    view.request.session = {}
+    view.request.user = AnonymousUser()
+    view.response_cookies = SimpleCookie()
+
+    get = view.build_subrequest({'method': 'GET', 'body': None}, urlsplit('/users/'))
+    post = view.build_subrequest({'method': 'POST', 'body': {}}, urlsplit('/users/'))
+
+    assert 'CONTENT_TYPE' not in get.META
+    assert post.content_type == 'application/json'
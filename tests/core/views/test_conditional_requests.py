@@ -0,0 +1,102 @@
+from django.test.client import RequestFactory
+
+from app.core.views import APIView
+from app.users.models import User
+
+import pytest
+
+
+class UserAPIView(APIView):
+    http_method_names = ['get']
+    model = User
+    last_modified_field = 'joined_at'
+    calls = 0
+
+    def get(self, request, *args, **kwargs):
+        UserAPIView.calls += 1
+        return self.render_to_json(data={'message': 'success'})
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    UserAPIView.calls = 0
+
+
+@pytest.fixture
+def user() -> User:
+    return User.objects.create(email='test@test.com')
+
+
+@pytest.mark.django_db
+def test_detail_response_has_validators(rf: RequestFactory, user: User):
+    response = UserAPIView.as_view()(rf.get('/dummy'), pk=user.pk)
+
+    assert response.status_code == 200
+    assert response['ETag'].startswith('W/"')
+    assert 'Last-Modified' in response
+
+
+@pytest.mark.django_db
+def test_matching_etag_skips_handler(rf: RequestFactory, user: User):
+    view = UserAPIView.as_view()
+    etag = view(rf.get('/dummy'), pk=user.pk)['ETag']
+
+    response = view(rf.get('/dummy', HTTP_IF_NONE_MATCH=etag), pk=user.pk)
+
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+    assert UserAPIView.calls == 1
+
+
+@pytest.mark.django_db
+def test_list_etag_changes_when_rows_change(rf: RequestFactory, user: User):
+    view = UserAPIView.as_view()
+    etag = view(rf.get('/dummy'))['ETag']
+
+    User.objects.create(email='other@test.com')
+    response = view(rf.get('/dummy', HTTP_IF_NONE_MATCH=etag))
+
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_list_etag_changes_when_rows_are_deleted(rf: RequestFactory, user: User):
+    User.objects.create(email='other@test.com')
+    view = UserAPIView.as_view()
+    etag = view(rf.get('/dummy'))['ETag']
+
+    user.delete()
+    response = view(rf.get('/dummy', HTTP_IF_NONE_MATCH=etag))
+
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_validators_are_opt_in(
+    rf: RequestFactory,
+    user: User,
+    django_assert_num_queries,
+):
+    class PlainUserAPIView(APIView):
+        http_method_names = ['get']
+        model = User
+
+        def get(self, request, *args, **kwargs):
+            return self.render_to_json(data={'message': 'success'})
+
+    with django_assert_num_queries(0):
+        response = PlainUserAPIView.as_view()(rf.get('/dummy'))
+
+    assert response.status_code == 200
+    assert 'ETag' not in response
+    assert 'Last-Modified' not in response
+
+
+@pytest.mark.django_db
+def test_missing_object_is_not_conditional(rf: RequestFactory):
+    response = UserAPIView.as_view()(rf.get('/dummy'), pk=1)
+
+    assert response.status_code == 404
+    assert 'ETag' not in response
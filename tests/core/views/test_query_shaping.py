@@ -0,0 +1,68 @@
+import json
+
+from django.contrib.auth.models import Group
+from django.test.client import RequestFactory
+
+from app.core.filters import BaseFilterSet
+from app.core.views import APIView
+from app.users.models import User
+
+import pytest
+
+
+class UserFilterSet(BaseFilterSet):
+    class Meta:
+        model = User
+        fields = ['email']
+
+
+class ShapedUserAPIView(APIView):
+    http_method_names = ['get']
+    model = User
+    prefetch_related = ('groups',)
+    only_fields = ('id', 'email')
+
+    def get(self, request, *args, **kwargs):
+        if self.object is not None:
+            return self.render_to_json(
+                data={
+                    'email': self.object.email,
+                    'deferred': sorted(self.object.get_deferred_fields()),
+                }
+            )
+
+        users = self.get_filtered_queryset(UserFilterSet, User.objects.order_by('pk'))
+        return self.render_to_json(
+            data={
+                'users': [[group.name for group in user.groups.all()] for user in users]
+            }
+        )
+
+
+@pytest.fixture
+def users() -> list[User]:
+    group = Group.objects.create(name='staff')
+    users = [User.objects.create(email=f'user{index}@test.com') for index in range(3)]
+    for user in users:
+        user.groups.add(group)
+    return users
+
+
+@pytest.mark.django_db
+def test_get_object_loads_only_the_declared_fields(rf: RequestFactory, users):
+    response = ShapedUserAPIView.as_view()(rf.get('/dummy'), pk=users[0].pk)
+
+    data = json.loads(response.content)
+    assert data['email'] == 'user0@test.com'
+    assert 'first_name' in data['deferred']
+    assert 'email' not in data['deferred']
+
+
+@pytest.mark.django_db
+def test_filtered_queryset_prefetches_relations(
+    rf: RequestFactory, users, django_assert_num_queries
+):
+    with django_assert_num_queries(2):
+        response = ShapedUserAPIView.as_view()(rf.get('/dummy'))
+
+    assert json.loads(response.content)['users'] == [['staff']] * 3
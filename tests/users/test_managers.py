@@ -0,0 +1,149 @@
+import datetime as dt
+import os
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.users.cache import get_user_cache, get_user_cache_key
+from app.users.models import User
+
+import pytest
+from allauth.account.models import EmailAddress
+
+
+@pytest.mark.django_db
+def test_bulk_create_users_reports_errors_per_row():
+    User.objects.create(email='taken@test.com')
+
+    result = User.objects.bulk_create_users(
+        [
+            {'email': 'One@Test.com', 'password': '123qaz123', 'first_name': 'One'},
+            {'email': 'taken@test.com', 'password': '123qaz123'},
+            {'email': 'one@test.com', 'password': '123qaz123'},
+            {'email': 'not an email', 'password': '123qaz123'},
+            {'email': 'two@test.com', 'password': None},
+        ],
+        batch_size=2,
+        workers=0,
+    )
+
+    assert [user.email for user in result.created] == ['one@test.com', 'two@test.com']
+    assert sorted(result.errors) == [1, 2, 3]
+    assert list(result.errors[3]) == ['email']
+
+    one = User.objects.get(email='one@test.com')
+    assert one.first_name == 'One'
+    assert one.check_password('123qaz123')
+    assert not User.objects.get(email='two@test.com').has_usable_password()
+    assert EmailAddress.objects.filter(user=one, primary=True).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_create_users_hashes_on_a_process_pool():
+    result = User.objects.bulk_create_users(
+        [
+            {'email': f'user{index}@test.com', 'password': 'secret'}
+            for index in range(2)
+        ],
+        workers=2,
+    )
+
+    assert not result.errors
+    assert all(user.check_password('secret') for user in result.created)
+
+
+@pytest.mark.django_db
+def test_bulk_create_users_defaults_to_a_worker_per_cpu(monkeypatch):
+    # os.process_cpu_count() only exists from Python 3.13.
+    monkeypatch.delattr(os, 'process_cpu_count', raising=False)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+
+    result = User.objects.bulk_create_users(
+        [{'email': f'user{index}@test.com', 'password': 'secret'} for index in range(2)]
+    )
+
+    assert len(result.created) == 2
+    assert User.objects.get(email='user1@test.com').check_password('secret')
+
+
+@pytest.mark.django_db
+def test_bulk_create_users_retries_a_chunk_row_by_row(monkeypatch):
+    User.objects.create(email='taken@test.com')
+    # Simulates the email being taken between the check and the insert.
+    monkeypatch.setattr(
+        type(User.objects), '_exclude_taken_emails', lambda *args, **kwargs: None
+    )
+
+    result = User.objects.bulk_create_users(
+        [{'email': 'taken@test.com'}, {'email': 'free@test.com'}],
+        workers=0,
+    )
+
+    assert [user.email for user in result.created] == ['free@test.com']
+    assert list(result.errors) == [0]
+    assert EmailAddress.objects.filter(email='free@test.com').count() == 1
+
+
+@pytest.mark.django_db
+def test_update_user_writes_only_changed_columns():
+    user = User.objects.create(email='user@test.com', first_name='Old')
+
+    with CaptureQueriesContext(connection) as queries:
+        changed = User.objects.update_user(
+            user,
+            {'first_name': 'New', 'last_name': '', 'birth_date': '2000-01-31'},
+        )
+
+    assert changed == ['first_name', 'birth_date']
+    (update,) = queries.captured_queries
+    assert '"last_name"' not in update['sql']
+    user.refresh_from_db()
+    assert user.birth_date == dt.date(2000, 1, 31)
+
+
+@pytest.mark.django_db
+def test_update_user_skips_unchanged_data():
+    user = User.objects.create(email='user@test.com', first_name='Same')
+
+    with CaptureQueriesContext(connection) as queries:
+        changed = User.objects.update_user(user, {'first_name': 'Same'})
+
+    assert changed == []
+    assert not queries.captured_queries
+
+
+@pytest.mark.django_db
+def test_update_user_rejects_the_email():
+    user = User.objects.create(email='user@test.com')
+
+    with pytest.raises(ValidationError) as exc_info:
+        User.objects.update_user(user, {'email': 'other@test.com'})
+    assert list(exc_info.value.message_dict) == ['email']
+
+
+@pytest.mark.django_db
+def test_bulk_update_users_groups_by_changed_fields(django_capture_on_commit_callbacks):
+    users = [User.objects.create(email=f'user{index}@test.com') for index in range(4)]
+    get_user_cache().set(get_user_cache_key(users[0].pk), 'stale')
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with CaptureQueriesContext(connection) as queries:
+            result = User.objects.bulk_update_users(
+                changes=[
+                    (users[0], {'first_name': 'A'}),
+                    (users[1], {'first_name': 'B'}),
+                    (users[2], {'last_name': 'C', 'first_name': ''}),
+                    (users[3], {'birth_date': 'not a date'}),
+                    (users[3], {'password': 'secret'}),
+                    (users[3], {'height': 180}),
+                ]
+            )
+
+    assert result.updated == users[:3]
+    assert list(result.errors) == [3, 4, 5]
+    assert list(result.errors[5]) == ['height']
+    updates = [query for query in queries.captured_queries if 'UPDATE' in query['sql']]
+    assert len(updates) == 2
+    assert get_user_cache().get(get_user_cache_key(users[0].pk)) is None
+    assert User.objects.get(pk=users[2].pk).last_name == 'C'
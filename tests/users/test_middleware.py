@@ -0,0 +1,84 @@
+from django.contrib.auth import HASH_SESSION_KEY
+from django.db import connection
+from django.test import Client
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from app.users.cache import get_user_cache
+from app.users.middleware import get_user
+from app.users.models import User
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    get_user_cache().clear()
+
+
+@pytest.fixture
+def logged_in_client() -> Client:
+    user = User.objects.create_user(email='test@test.com', password='123qaz123')
+    client = Client()
+    client.force_login(user, backend='django.contrib.auth.backends.ModelBackend')
+    return client
+
+
+def load_user(rf: RequestFactory, client: Client) -> User:
+    request = rf.get('/dummy')
+    request.session = client.session
+    return get_user(request)
+
+
+def count_user_queries(context: CaptureQueriesContext) -> int:
+    return sum('"users"' in query['sql'] for query in context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_cached_user_loads_without_queries(rf: RequestFactory, logged_in_client):
+    load_user(rf, logged_in_client)
+
+    with CaptureQueriesContext(connection) as context:
+        user = load_user(rf, logged_in_client)
+
+    assert user.email == 'test@test.com'
+    assert count_user_queries(context) == 0
+
+
+@pytest.mark.django_db
+def test_cached_user_is_invalidated_on_save(rf: RequestFactory, logged_in_client):
+    user = load_user(rf, logged_in_client)
+    User.objects.filter(pk=user.pk).update(first_name='Stale')
+    user.first_name = 'Fresh'
+    user.save()
+
+    assert load_user(rf, logged_in_client).first_name == 'Fresh'
+
+
+@pytest.mark.django_db
+def test_deactivated_user_is_logged_out(rf: RequestFactory, logged_in_client):
+    user = load_user(rf, logged_in_client)
+    user.is_active = False
+    user.save()
+
+    assert not load_user(rf, logged_in_client).is_authenticated
+
+
+@pytest.mark.django_db
+def test_bulk_deactivated_user_is_logged_out(rf: RequestFactory, logged_in_client):
+    user = load_user(rf, logged_in_client)
+    User.objects.bulk_update_users([(user, {'is_active': False})])
+
+    assert not load_user(rf, logged_in_client).is_authenticated
+
+
+@pytest.mark.django_db
+def test_password_change_invalidates_the_session(rf: RequestFactory, logged_in_client):
+    user = load_user(rf, logged_in_client)
+    user.set_password('changed')
+    user.save()
+
+    request = rf.get('/dummy')
+    request.session = logged_in_client.session
+    assert not get_user(request).is_authenticated
+    assert HASH_SESSION_KEY not in request.session
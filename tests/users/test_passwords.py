@@ -0,0 +1,62 @@
+from io import StringIO
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management import call_command
+from django.test import override_settings
+
+from app.users.models import User
+
+import pytest
+from allauth.account.models import EmailAddress
+from asgiref.sync import async_to_sync
+
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+class FastPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = 1
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+def test_acreate_user_and_acheck_password():
+    user = async_to_sync(User.objects.acreate_user)(
+        email='Test@Test.com', password='123qaz123'
+    )
+
+    assert user.email == 'test@test.com'
+    assert EmailAddress.objects.filter(user=user, primary=True).exists()
+    assert async_to_sync(user.acheck_password)('123qaz123')
+    assert not async_to_sync(user.acheck_password)('wrong')
+
+
+@pytest.mark.django_db
+def test_check_password_upgrades_outdated_hashes():
+    with override_settings(PASSWORD_HASHERS=FAST_HASHERS):
+        user = User.objects.create_user(email='test@test.com', password='123qaz123')
+
+    with override_settings(
+        PASSWORD_HASHERS=[
+            f'{__name__}.FastPBKDF2PasswordHasher',
+            *FAST_HASHERS,
+        ]
+    ):
+        assert user.check_password('123qaz123')
+
+    user.refresh_from_db()
+    assert user.password.startswith('pbkdf2_sha256$1$')
+
+
+@override_settings(
+    PASSWORD_HASHERS=[
+        'django.contrib.auth.hashers.ScryptPasswordHasher',
+        *FAST_HASHERS,
+    ]
+)
+def test_calibrate_password_hashers_recommends_work_factors():
+    stdout = StringIO()
+    call_command('calibrate_password_hashers', samples=1, stdout=stdout)
+
+    output = stdout.getvalue()
+    assert 'recommended work_factor=' in output
+    assert 'md5: ' in output
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from app.users import models
@@ -39,3 +41,42 @@ def test_to_create_a_new_email_address():
     assert EmailAddress.objects.filter(email='test@test.com').exists()
 
 
+
+
+@pytest.mark.django_db
+def test_to_reject_an_email_in_use_regardless_of_case():
+    models.User.objects.create_user(email='test@test.com', password='123qaz123')
+
+    response = Client().post(
+        path=reverse('create_list_users'),
+        data={
+            'first_name': 'Test',
+            'email': 'Test@TEST.com',
+            'password1': '123qaz123',
+            'password2': '123qaz123',
+        },
+        content_type='application/json',
+    )
+
+    assert response.status_code == 400
+    assert 'email' in response.json()['errors']
+    assert models.User.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_to_create_a_new_user_without_lookups():
+    with CaptureQueriesContext(connection) as context:
+        Client().post(
+            path=reverse('create_list_users'),
+            data={
+                'first_name': 'Test',
+                'email': 'test@test.com',
+                'password1': '123qaz123',
+                'password2': '123qaz123',
+            },
+            content_type='application/json',
+        )
+
+    statements = [query['sql'].split()[0] for query in context.captured_queries]
+    assert statements.count('INSERT') == 2
+    assert 'SELECT' not in statements
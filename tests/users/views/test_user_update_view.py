@@ -0,0 +1,58 @@
+import json
+
+from django.test import Client
+from django.urls import reverse
+
+from app.users.models import User
+
+import pytest
+
+
+@pytest.fixture
+def logged_in_user(client: Client) -> User:
+    user = User.objects.create(
+        email='user@test.com', first_name='Old', last_name='Name'
+    )
+    client.force_login(user)
+    return user
+
+
+@pytest.mark.django_db
+def test_to_update_only_the_submitted_fields(client: Client, logged_in_user: User):
+    response = client.post(
+        reverse('update_detail_users', kwargs={'pk': logged_in_user.pk}),
+        data={'first_name': 'New'},
+        content_type='application/json',
+    )
+
+    assert response.status_code == 200
+    logged_in_user.refresh_from_db()
+    assert logged_in_user.first_name == 'New'
+    assert logged_in_user.last_name == 'Name'
+
+
+@pytest.mark.django_db
+def test_to_reject_invalid_fields(client: Client, logged_in_user: User):
+    response = client.post(
+        reverse('update_detail_users', kwargs={'pk': logged_in_user.pk}),
+        data={'birth_date': 'yesterday'},
+        content_type='application/json',
+    )
+
+    assert response.status_code == 400
+    assert 'birth_date' in json.loads(response.content)['errors']
+
+
+@pytest.mark.django_db
+def test_to_not_update_another_user(client: Client, logged_in_user: User):
+    other = User.objects.create(email='other@test.com', first_name='Other')
+
+    response = client.post(
+        reverse('update_detail_users', kwargs={'pk': other.pk}),
+        data={'first_name': 'New'},
+        content_type='application/json',
+    )
+
+    assert response.status_code == 404
+    other.refresh_from_db()
+    assert other.first_name == 'Other'